@@ -1,19 +1,25 @@
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 
-# Load the data
-df_batting = pd.read_csv("final_batting_data.csv")
-df_bowling = pd.read_csv("final_bowling_data.csv")
-df_fielding = pd.read_csv("final_fielding_data.csv")
+from modules.cube import cube_slice, cube_totals
+from modules.data_loader import load_cube, load_table
+
+TEAM = "SPVGG Dragons"
+
+# Load the data (cached per process by the data layer)
+df_batting = load_table("batting")
+df_bowling = load_table("bowling")
+df_fielding = load_table("fielding")
+cube = load_cube()
+team_totals = cube_totals(cube, team=TEAM)
 
 st.title("🐉 SPVGG Dragons - Team Overview")
 # TEAM SUMMARY METRICS
 st.subheader("🏏 BATTING")
-total_runs = df_batting["Runs"].sum()
+total_runs = int(team_totals["runs"])
 total_matches = df_batting["Matches"].max()
-total_4s = df_batting["4s"].sum()
-total_6s = df_batting["6s"].sum()
+total_4s = int(team_totals["4s"])
+total_6s = int(team_totals["6s"])
 col1, col2, col3, col4 = st.columns(4)
 col1.metric("Total Runs", total_runs)
 col2.metric("Matches Played", total_matches)
@@ -21,10 +27,11 @@ col3.metric("Total 4s", total_4s)
 col4.metric("Total 6s", total_6s)
 
 st.subheader("⚾ BOWLING")
-total_wickets = df_bowling["Wickets"].sum()
-total_runs = df_bowling["Runs Conceded"].sum()
+total_wickets = int(team_totals["wickets"])
+total_runs = int(team_totals["runs_conceded"])
 avg_economy = df_bowling["Economy"].mean()
-total_overs = df_bowling["Overs Bowled"].sum()
+balls_bowled = int(team_totals["balls_bowled"])
+total_overs = float(f"{balls_bowled // 6}.{balls_bowled % 6}")
 col1, col2, col3, col4 = st.columns(4)
 col1.metric("Total Wickets", total_wickets)
 col2.metric("Total Runs Conceded", total_runs)
@@ -32,16 +39,28 @@ col3.metric("Avg Economy", round(avg_economy, 2))
 col4.metric("Overs Bowled", total_overs)
 
 st.subheader("🧤 FIELDING")
-total_catches = (df_fielding["Catches"] + df_fielding["Caught Behind"]).sum()
-total_run_outs = df_fielding["Run Outs"].sum()
-total_stumpings = df_fielding["Stumpings"].sum()
-total_dismissals = df_fielding["Total Dismissals"].sum()
+total_catches = int(team_totals["catches"] + team_totals["caught_behind"])
+total_run_outs = int(team_totals["run_outs"])
+total_stumpings = int(team_totals["stumpings"])
+total_dismissals = int(team_totals["dismissals"])
 col1, col2, col3, col4 = st.columns(4)
 col1.metric("Total Catches", total_catches)
 col2.metric("Total Run Outs", total_run_outs)
 col3.metric("Total Stumpings", total_stumpings)
 col4.metric("Total Dismissals", total_dismissals)
 
+# TOURNAMENT BREAKDOWN - straight from the rollup cube
+st.subheader("🏆 Performance by Tournament")
+by_tournament = cube_slice(cube, by=["tournament"], team=TEAM)
+fig0 = px.bar(
+    by_tournament,
+    x="tournament",
+    y=["runs", "wickets", "dismissals"],
+    barmode="group",
+    labels={"tournament": "", "value": "Total", "variable": ""},
+)
+st.plotly_chart(fig0, use_container_width=True)
+
 # DONUT CHART - RUNS CONTRIBUTION
 st.subheader("🎯 Run Contribution by Player")
 top_scorers = df_batting[df_batting["Runs"] > 0].sort_values(by="Runs", ascending=False)
@@ -0,0 +1,142 @@
+import gzip
+import json
+from functools import lru_cache
+
+from flask import Flask, Response, abort, request
+from werkzeug.exceptions import HTTPException
+
+from modules.cube import cube_slice
+from modules.data_loader import dataset_version, load_cube, load_indexed, load_table
+
+app = Flask(__name__)
+
+LEADERBOARDS = ["batting", "bowling", "fielding", "mvp"]
+DEFAULT_PER_PAGE = 50
+MAX_PER_PAGE = 500
+CACHE_SECONDS = 60
+
+
+def _json(meta, frame=None, key="items"):
+    """Serialize metadata plus a DataFrame (as a list of records) into one JSON document."""
+    body = json.dumps(meta, ensure_ascii=False)
+    if frame is None:
+        return body
+    records = frame.to_json(orient="records", force_ascii=False)
+    return f'{body[:-1]}, "{key}": {records}}}'
+
+
+def _page_args():
+    try:
+        page = max(int(request.args.get("page", 1)), 1)
+        per_page = min(max(int(request.args.get("per_page", DEFAULT_PER_PAGE)), 1), MAX_PER_PAGE)
+    except ValueError:
+        abort(400, "page and per_page must be integers")
+    return page, per_page
+
+
+@lru_cache(maxsize=256)
+def _render(endpoint, args, version):
+    """
+    Build the response body for one endpoint and its arguments. `version` is part
+    of the cache key, so a rebuilt data set never serves a stale body.
+
+    Returns:
+        A (body bytes, gzipped body bytes) tuple, or None if the resource does not exist.
+    """
+    if endpoint == "leaderboard":
+        name, page, per_page = args
+        df = load_table(name)
+        start = (page - 1) * per_page
+        meta = {"dataset_version": version, "leaderboard": name, "page": page,
+                "per_page": per_page, "total": len(df)}
+        body = _json(meta, df.iloc[start:start + per_page])
+
+    elif endpoint == "teams":
+        teams = cube_slice(load_cube(), by=["team"]).sort_values("team")
+        body = _json({"dataset_version": version, "total": len(teams)}, teams)
+
+    elif endpoint == "team":
+        (team,) = args
+        tournaments = cube_slice(load_cube(), by=["tournament"], team=team)
+        if tournaments.empty:
+            return None
+        totals = cube_slice(load_cube(), team=team)
+        meta = {"dataset_version": version, "team": team,
+                "totals": json.loads(totals.to_json(orient="records"))[0]}
+        body = _json(meta, tournaments, key="tournaments")
+
+    elif endpoint == "player":
+        (player_id,) = args
+        profile = {}
+        for name in LEADERBOARDS + ["percentiles"]:
+            rows = load_indexed(name).reindex([player_id]).dropna(how="all")
+            profile[name] = json.loads(rows.to_json(orient="records"))[0] if len(rows) else None
+        if not any(profile.values()):
+            return None
+        body = json.dumps({"dataset_version": version, "player_id": player_id, **profile}, ensure_ascii=False)
+
+    else:
+        raise ValueError(f"Unknown endpoint: {endpoint}")
+
+    raw = body.encode("utf-8")
+    return raw, gzip.compress(raw, compresslevel=6)
+
+
+def _respond(endpoint, args):
+    """
+    Serve a cached body with validators tied to the dataset version: clients
+    revalidate with If-None-Match / If-Modified-Since and get a 304 when nothing
+    was rebuilt. Bodies are gzipped when the client accepts it.
+    """
+    version, last_modified = dataset_version()
+    rendered = _render(endpoint, args, version)
+    if rendered is None:
+        abort(404, f"No such {endpoint}")
+
+    # By quality, not presence: "gzip;q=0" means the client refuses gzip
+    use_gzip = request.accept_encodings["gzip"] > 0
+    response = Response(rendered[1] if use_gzip else rendered[0], mimetype="application/json")
+    if use_gzip:
+        response.headers["Content-Encoding"] = "gzip"
+    response.headers["Vary"] = "Accept-Encoding"
+    response.cache_control.public = True
+    response.cache_control.max_age = CACHE_SECONDS
+    response.set_etag(f"{version}-gzip" if use_gzip else version)
+    response.last_modified = last_modified
+    return response.make_conditional(request)
+
+
+@app.errorhandler(HTTPException)
+def json_error(error):
+    """Report errors (404, 400, 405, ...) as JSON with the same status code, like every other response."""
+    response = error.get_response()
+    response.set_data(json.dumps({"error": error.description}, ensure_ascii=False))
+    response.mimetype = "application/json"
+    return response
+
+
+@app.route("/api/leaderboards/<name>")
+def leaderboard(name):
+    if name not in LEADERBOARDS:
+        abort(404, f"Unknown leaderboard {name!r}, expected one of {LEADERBOARDS}")
+    page, per_page = _page_args()
+    return _respond("leaderboard", (name, page, per_page))
+
+
+@app.route("/api/teams")
+def teams():
+    return _respond("teams", ())
+
+
+@app.route("/api/teams/<team>")
+def team(team):
+    return _respond("team", (team,))
+
+
+@app.route("/api/players/<int(signed=True):player_id>")
+def player(player_id):
+    return _respond("player", (player_id,))
+
+
+if __name__ == '__main__':
+    app.run(host="0.0.0.0", port=8000)
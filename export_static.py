@@ -0,0 +1,396 @@
+import argparse
+import hashlib
+import html
+import importlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+import plotly.express as px
+from plotly.offline import get_plotlyjs_version
+
+from modules.cube import cube_slice
+from modules.data_loader import data_path, load_cube, load_indexed, load_player_directory, load_profiles
+from modules.similarity import most_similar
+from modules.snapshots import SNAPSHOT_DIR
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# (script, output file, navigation title, inputs: data tables or "snapshots")
+PAGES = [
+    ("Home.py", "index.html", "Team Overview", ["batting", "bowling", "fielding", "cube"]),
+    ("pages/Batting.py", "batting.html", "Batting", ["batting"]),
+    ("pages/Bowling.py", "bowling.html", "Bowling", ["bowling", "cube"]),
+    ("pages/Fielding.py", "fielding.html", "Fielding", ["fielding"]),
+    ("pages/Season_Simulator.py", "season-simulator.html", "Season Simulator", ["batting", "bowling"]),
+    ("pages/Team_Selector.py", "team-selector.html", "Team Selector", ["batting", "bowling", "fielding", "mvp"]),
+    ("pages/Movers.py", "movers.html", "Movers", ["snapshots"]),
+]
+PLAYER_PAGE = "pages/Search_Player.py"
+PLAYER_VIEWS = {"batting": "Batting Stats", "bowling": "Bowling Stats", "fielding": "Fielding Stats"}
+PLAYER_TABLES = ["batting", "bowling", "fielding"]
+SIMILAR_SHOWN = 5   # Neighbours the player page lists by default
+# Timings of the render itself, not of the data: left out so a re-render of unchanged inputs is byte-identical
+TIMING_METRICS = {"Run Time", "Throughput", "Solved In"}
+
+MANIFEST = "manifest.json"
+SHARED_CODE = ["export_static.py", "modules"]   # Every job renders through these
+
+PLOTLY_JS = f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+
+STYLE = """
+body { font-family: "Source Sans Pro", sans-serif; margin: 0 auto; max-width: 1100px; padding: 0 1rem 3rem; color: #31333f; }
+nav { display: flex; gap: 1rem; padding: 1rem 0; border-bottom: 1px solid #e6e6e6; flex-wrap: wrap; }
+nav a { color: #ff4b4b; text-decoration: none; }
+.row { display: flex; gap: 1rem; }
+.row > div { flex: 1; min-width: 0; }
+.metric-label { font-size: 0.9rem; }
+.metric-value { font-size: 2rem; }
+.notice { padding: 0.75rem 1rem; border-radius: 0.5rem; background: #fffce7; }
+table { border-collapse: collapse; font-size: 0.9rem; }
+th, td { padding: 0.25rem 0.5rem; border-bottom: 1px solid #e6e6e6; text-align: right; }
+.caption { color: #808495; font-size: 0.85rem; }
+"""
+
+RENDER_SCRIPT = """
+document.querySelectorAll("script[data-chart]").forEach(function (spec) {
+  var fig = JSON.parse(spec.textContent);
+  Plotly.newPlot(spec.dataset.chart, fig.data, fig.layout, {responsive: true, displaylogo: false});
+});
+"""
+
+
+def slugify(text):
+    return re.sub(r"[^a-z0-9]+", "-", str(text).lower()).strip("-") or "unnamed"
+
+
+def _fingerprint(paths):
+    """Hash the contents of files (and every file below directories) in a stable order."""
+    digest = hashlib.sha1()
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += [os.path.join(root, f) for root, _, names in os.walk(path)
+                      if "__pycache__" not in root for f in names]
+        elif os.path.exists(path):
+            files.append(path)
+    for path in sorted(files):
+        digest.update(os.path.relpath(path, BASE_DIR).encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _combine(*parts):
+    return hashlib.sha1(":".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+
+def _frame_digest(df):
+    """Hash the values (and index) of a frame, independent of how it was loaded."""
+    return hashlib.sha1(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes()).hexdigest()
+
+
+def page_fingerprints(code):
+    """Per dashboard page: its script, the shared code and only the inputs the page reads."""
+    fingerprints = {}
+    for script, out, _, inputs in PAGES:
+        paths = [SNAPSHOT_DIR if name == "snapshots" else data_path(name) for name in inputs]
+        fingerprints[out] = _combine(code, _fingerprint([os.path.join(BASE_DIR, script)] + paths))
+    return fingerprints
+
+
+def team_fingerprints(code, cube, teams):
+    """Per team view: the team's own cube rows."""
+    return {team: _combine(code, _frame_digest(cube_slice(cube, by=["tournament"], team=team))) for team in teams}
+
+
+def player_fingerprints(code, directory):
+    """
+    Per player: everything their profile page shows, i.e. the player's own rows
+    of the stats tables, their label and the neighbours listed as similar. A
+    rebuild that leaves those untouched does not re-render the player's pages.
+    """
+    ids = directory.index
+    code = _combine(code, _fingerprint([os.path.join(BASE_DIR, PLAYER_PAGE)]))
+    # One hash per player and table; a player missing from a table hashes as an empty row
+    row_hashes = pd.DataFrame({
+        table: pd.util.hash_pandas_object(load_indexed(table).reindex(ids), index=False).to_numpy()
+        for table in PLAYER_TABLES
+    }, index=ids)
+
+    players, matrix = load_profiles()
+    with_profile = [pid for pid in ids if pid in set(players["Player ID"])]
+    similar = most_similar(players, matrix, with_profile, k=SIMILAR_SHOWN)
+    similar_hashes = similar.groupby("Player ID").apply(
+        lambda rows: _frame_digest(rows.reset_index(drop=True)), include_groups=False
+    ).reindex(ids)
+
+    return {
+        pid: _combine(code, directory.loc[pid, "Label"], *row_hashes.loc[pid], similar_hashes.loc[pid])
+        for pid in ids
+    }
+
+
+# --- HTML rendering ---
+
+def _chart(spec, n):
+    spec = spec.replace("</", "<\\/")
+    return f'<div id="chart-{n}"></div><script type="application/json" data-chart="chart-{n}">{spec}</script>'
+
+
+def _table(df, show_index):
+    return df.to_html(index=show_index, border=0, na_rep="", float_format=lambda v: f"{v:,.2f}")
+
+
+def _metric(label, value):
+    return (f'<div class="metric"><div class="metric-label">{html.escape(str(label))}</div>'
+            f'<div class="metric-value">{html.escape(str(value))}</div></div>')
+
+
+def _render_node(node, counter):
+    """Convert one node of an AppTest element tree into HTML."""
+    kind = node.type
+    if kind in ("title", "header", "subheader"):
+        tag = {"title": "h1", "header": "h2", "subheader": "h3"}[kind]
+        return f"<{tag}>{html.escape(node.value)}</{tag}>"
+    if kind == "markdown":
+        return f"<p>{html.escape(node.value)}</p>"
+    if kind == "caption":
+        return f'<p class="caption">{html.escape(node.value)}</p>'
+    if kind in ("alert", "warning", "info", "error", "success"):
+        return f'<div class="notice">{html.escape(node.value)}</div>'
+    if kind == "metric":
+        return "" if node.label in TIMING_METRICS else _metric(node.label, node.value)
+    if kind == "arrow_data_frame":
+        df = node.value
+        return _table(df, show_index=df.index.name is not None)
+    if kind == "plotly_chart":
+        counter[0] += 1
+        return _chart(node.proto.spec, counter[0])
+
+    children = "".join(_render_node(c, counter) for c in getattr(node, "children", {}).values())
+    if kind == "expandable":
+        return f"<details><summary>{html.escape(node.label)}</summary>{children}</details>"
+    if kind == "flex_container" and any(c.type == "column" for c in node.children.values()):
+        return f'<div class="row">{"".join(f"<div>{_render_node(c, counter)}</div>" for c in node.children.values())}</div>'
+    # Columns, plain containers and widgets: the static copy keeps only their content
+    return children
+
+
+def render_document(title, body, depth=0):
+    """Wrap rendered content in a standalone HTML page with site navigation."""
+    prefix = "../" * depth
+    links = [(f"{prefix}{out}", name) for _, out, name, _ in PAGES]
+    links += [(f"{prefix}teams/index.html", "Teams"), (f"{prefix}players/index.html", "Players")]
+    nav = "".join(f'<a href="{href}">{html.escape(name)}</a>' for href, name in links)
+    return (
+        "<!DOCTYPE html>\n"
+        f'<html lang="en"><head><meta charset="utf-8"><title>{html.escape(title)}</title>'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">'
+        f'<style>{STYLE}</style><script src="{PLOTLY_JS}" charset="utf-8"></script></head>'
+        f"<body><nav>{nav}</nav><main>{body}</main><script>{RENDER_SCRIPT}</script></body></html>\n"
+    )
+
+
+# --- Page jobs (run in worker processes) ---
+
+def init_worker():
+    """Render charts with a plain Plotly template instead of Streamlit's theme placeholders."""
+    import plotly.io as pio
+
+    # Importing Streamlit's chart module makes "streamlit" the default template; import it
+    # before overriding, or the first page to import it would undo the override
+    importlib.import_module("streamlit.elements.plotly_chart")
+
+    pio.templates.default = "plotly_white"
+
+
+def _run_page(script, widgets=()):
+    from streamlit.testing.v1 import AppTest
+
+    # AppTest installs the page as __main__; put ours back so this worker can
+    # still unpickle the job functions defined in this script
+    main = sys.modules["__main__"]
+    try:
+        at = AppTest.from_file(os.path.join(BASE_DIR, script), default_timeout=60).run()
+        for kind, key, value in widgets:
+            getattr(at, kind)(key=key).set_value(value)
+        if widgets:
+            at.run()
+    finally:
+        sys.modules["__main__"] = main
+    if at.exception:
+        raise RuntimeError(f"{script} failed: {at.exception[0].message}")
+    return at
+
+
+def render_page(script, title):
+    at = _run_page(script)
+    return render_document(title, _render_node(at.main, [0]))
+
+
+def render_player(player_id, view, stem):
+    at = _run_page(PLAYER_PAGE, [("radio", "mode", "Single Player"), ("selectbox", "player", player_id),
+                                 ("radio", "view_type", PLAYER_VIEWS[view])])
+    tabs = "".join(f'<a href="{stem}-{v}.html">{label}</a> ' for v, label in PLAYER_VIEWS.items())
+    title = load_player_directory().loc[player_id, "Label"]
+    return render_document(title, f"<p>{tabs}</p>" + _render_node(at.main, [0]), depth=1)
+
+
+def render_team(team):
+    cube = load_cube()
+    totals = cube_slice(cube, team=team).iloc[0]
+    by_tournament = cube_slice(cube, by=["tournament"], team=team)
+
+    metrics = [("Runs", int(totals["runs"])), ("Wickets", int(totals["wickets"])),
+               ("Dismissals", int(totals["dismissals"])), ("Players", int(totals["players"])),
+               ("MVP Points", round(float(totals["mvp_points"]), 1))]
+    fig = px.bar(
+        by_tournament,
+        x="tournament",
+        y=["runs", "wickets", "dismissals"],
+        barmode="group",
+        labels={"tournament": "", "value": "Total", "variable": ""},
+    )
+    table = by_tournament[["tournament", "players", "runs", "balls_faced", "wickets", "balls_bowled",
+                           "runs_conceded", "dismissals", "mvp_points"]]
+    body = (
+        f"<h1>{html.escape(team)}</h1>"
+        f'<div class="row">{"".join(f"<div>{_metric(label, value)}</div>" for label, value in metrics)}</div>'
+        "<h3>🏆 Performance by Tournament</h3>"
+        + _chart(fig.to_json(), 1)
+        + _table(table, show_index=False)
+    )
+    return render_document(team, body, depth=1)
+
+
+def run_job(job, output_dir, old_sha):
+    """
+    Render one page and write it only when its content changed, so unchanged
+    files keep their timestamps and a sync to static hosting skips them.
+
+    Returns:
+        The output path, the sha1 of the rendered page and whether it was written.
+    """
+    kind, path, args = job
+    document = {"page": render_page, "player": render_player, "team": render_team}[kind](*args)
+    data = document.encode("utf-8")
+    sha = hashlib.sha1(data).hexdigest()
+
+    target = os.path.join(output_dir, path)
+    written = sha != old_sha or not os.path.exists(target)
+    if written:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        tmp = f"{target}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, target)
+    return path, sha, written
+
+
+# --- Export driver ---
+
+def _index_page(title, links):
+    items = "".join(f'<li><a href="{href}">{html.escape(str(label))}</a></li>' for href, label in links)
+    return render_document(title, f"<h1>{html.escape(title)}</h1><ul>{items}</ul>", depth=1)
+
+
+def export_site(output_dir="site", workers=None, force=False):
+    """
+    Prerender every dashboard page, team view and player profile to static HTML.
+
+    Pages are rendered by running the real page scripts, so the static site
+    matches the live dashboard. A manifest records, per file, the fingerprint of
+    that file's own inputs (the tables a page reads, a team's cube rows, a
+    player's stats and similar players, plus the rendering code); on refresh
+    only files whose inputs changed are rendered again.
+
+    Parameters:
+        output_dir: Directory the site is written to.
+        workers: Number of worker processes (defaults to the CPU count).
+        force: Re-render every page even if its inputs are unchanged.
+
+    Returns:
+        A dict with the number of rendered, written, skipped and removed files.
+    """
+    output_dir = os.path.abspath(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST)
+    manifest = {}
+    if os.path.exists(manifest_path) and not force:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+
+    # --- Step 1: Collect jobs and the fingerprint of each one's inputs ---
+    code = _fingerprint([os.path.join(BASE_DIR, p) for p in SHARED_CODE])
+    cube = load_cube()
+    teams = cube_slice(cube, by=["team"])["team"].sort_values().tolist()
+    # The players offered by the search page, one set of files per id
+    directory = load_player_directory()
+    players = directory["Label"]
+    player_files = {player_id: slugify(player_id) for player_id in players.index}
+
+    jobs, fingerprints = [], page_fingerprints(code)
+    jobs += [("page", out, (script, title)) for script, out, title, _ in PAGES]
+    for team, fingerprint in team_fingerprints(code, cube, teams).items():
+        path = f"teams/{slugify(team)}.html"
+        jobs.append(("team", path, (team,)))
+        fingerprints[path] = fingerprint
+    for pid, fingerprint in player_fingerprints(code, directory).items():
+        for view in PLAYER_VIEWS:
+            path = f"players/{player_files[pid]}-{view}.html"
+            jobs.append(("player", path, (pid, view, player_files[pid])))
+            fingerprints[path] = _combine(fingerprint, view)
+
+    # --- Step 2: Render stale pages in parallel ---
+    todo = [job for job in jobs
+            if manifest.get(job[1], {}).get("input") != fingerprints[job[1]]
+            or not os.path.exists(os.path.join(output_dir, job[1]))]
+    written = 0
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+            futures = [pool.submit(run_job, job, output_dir, manifest.get(job[1], {}).get("sha")) for job in todo]
+            for future in as_completed(futures):
+                path, sha, was_written = future.result()
+                manifest[path] = {"input": fingerprints[path], "sha": sha}
+                written += was_written
+
+    # --- Step 3: Index pages (cheap, always rebuilt) ---
+    indexes = {
+        "teams/index.html": _index_page("Teams", [(f"{slugify(t)}.html", t) for t in teams]),
+        "players/index.html": _index_page("Players", [(f"{player_files[pid]}-batting.html", label)
+                                                      for pid, label in players.items()]),
+    }
+    for path, document in indexes.items():
+        os.makedirs(os.path.dirname(os.path.join(output_dir, path)), exist_ok=True)
+        with open(os.path.join(output_dir, path), "w", encoding="utf-8") as f:
+            f.write(document)
+
+    # --- Step 4: Remove pages that no longer exist (e.g. a player left) ---
+    current = {job[1] for job in jobs}
+    removed = [path for path in manifest if path not in current]
+    for path in removed:
+        del manifest[path]
+        if os.path.exists(os.path.join(output_dir, path)):
+            os.remove(os.path.join(output_dir, path))
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+
+    return {"rendered": len(todo), "written": written, "skipped": len(jobs) - len(todo), "removed": len(removed)}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Export the dashboard as a static site.")
+    parser.add_argument("--output", default="site", help="output directory")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="re-render every page")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = export_site(args.output, args.workers, args.force)
+    print(f"{stats} in {time.perf_counter() - start:.1f}s -> {os.path.abspath(args.output)}")
@@ -0,0 +1,13 @@
+import os
+
+from modules.sources import ARCHIVE_DIR, scan_archives
+
+
+if __name__ == '__main__':
+    # Run first whenever exports are added to Data/archives: the other builders
+    # only read the members recorded here, parsed once per archive
+    manifest, changed = scan_archives()
+    print(f"{manifest['archive'].nunique()} archives, {len(manifest)} leaderboards "
+          f"in {os.path.relpath(ARCHIVE_DIR)} ({len(changed)} parsed)")
+    for archive in changed:
+        print(f"  {archive}")
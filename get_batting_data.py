@@ -1,11 +1,23 @@
 import pandas as pd
 
-def merge_cricket_stats(*dfs):
+from modules.identity import load_identity_map, resolve_player_ids
+from modules.snapshots import record_snapshot
+from modules.sources import all_tournaments, read_leaderboard
+
+# Display names for the columns of final_batting_data.csv
+FINAL_COLUMNS = ["Player ID", "Name", "Team", "Matches", "Innings", "Runs", "Highest", "Average", "Not Outs", "Strike Rate",
+                 "Balls Faced", "Batting Hand", "4s", "6s", "50s", "100s", "Total Boundaries",
+                 "Boundary Runs", "Boundary %", "Balls/Boundary", "Non-Boundary SR", "Conversion Rate",
+                 "Dismissal Rate"]
+
+def merge_cricket_stats(*dfs, identity=None):
     """
     Merge any number of cricket stats DataFrames and sum relevant stats.
 
     Parameters:
         *dfs: Two or more pandas DataFrames with similar structure (cricket stats).
+        identity: Optional identity map (see modules.identity) used to resolve
+                  canonical player ids and names before merging.
 
     Returns:
         A merged and cleaned DataFrame with combined stats.
@@ -13,6 +25,9 @@ def merge_cricket_stats(*dfs):
     if len(dfs) < 2:
         raise ValueError("You must provide at least 2 dataframes.")
 
+    if identity is not None:
+        dfs = [resolve_player_ids(df, identity) for df in dfs]
+
     # Step 1: Generate suffixes dynamically
     suffixes = [''] + [f'_{i}' for i in range(1, len(dfs))]
 
@@ -41,6 +56,19 @@ def merge_cricket_stats(*dfs):
     merged['average'] = (merged['total_runs'] / dismissals).round(2)
     merged['strike_rate'] = (merged['total_runs'] / merged['ball_faced'].replace(0, 1) * 100).round(2)
 
+    # Step 5b: Extended metrics, computed once here so pages only select columns
+    merged['total_boundaries'] = merged['4s'] + merged['6s']
+    merged['boundary_runs'] = merged['4s'] * 4 + merged['6s'] * 6
+    runs = merged['total_runs'].where(merged['total_runs'] > 0)
+    merged['boundary_pct'] = (merged['boundary_runs'] / runs * 100).fillna(0).round(2)
+    boundaries = merged['total_boundaries'].where(merged['total_boundaries'] > 0)
+    merged['balls_per_boundary'] = (merged['ball_faced'] / boundaries).fillna(0).round(2)
+    other_balls = (merged['ball_faced'] - merged['total_boundaries']).where(lambda s: s > 0)
+    merged['non_boundary_sr'] = ((merged['total_runs'] - merged['boundary_runs']) / other_balls * 100).fillna(0).round(2)
+    innings = merged['innings'].where(merged['innings'] > 0)
+    merged['conversion_rate'] = ((merged['50s'] + merged['100s']) / innings).fillna(0).round(2)
+    merged['dismissal_rate'] = ((merged['innings'] - merged['not_out']) / innings).fillna(0).round(2)
+
     # Step 6: Combine metadata (name, team_name, batting_hand)
     metadata_cols = ['name', 'team_name', 'batting_hand']
     for col in metadata_cols:
@@ -52,7 +80,8 @@ def merge_cricket_stats(*dfs):
     # Step 7: Final column selection
     final_cols = ['player_id', 'name', 'team_name', 'total_match', 'innings', 'total_runs',
                   'highest_run', 'average', 'not_out', 'strike_rate', 'ball_faced', 'batting_hand',
-                  '4s', '6s', '50s', '100s']
+                  '4s', '6s', '50s', '100s', 'total_boundaries', 'boundary_runs', 'boundary_pct',
+                  'balls_per_boundary', 'non_boundary_sr', 'conversion_rate', 'dismissal_rate']
 
     final_df = merged[final_cols].copy()
 
@@ -61,7 +90,8 @@ def merge_cricket_stats(*dfs):
     final_df['average'] = final_df['average'].round(2)
 
     # Convert all other numeric columns to integers where applicable
-    exclude_cols = ['strike_rate', 'average']
+    exclude_cols = ['strike_rate', 'average', 'boundary_pct', 'balls_per_boundary',
+                    'non_boundary_sr', 'conversion_rate', 'dismissal_rate']
     for col in final_df.columns:
         if col not in exclude_cols:
             try:
@@ -77,34 +107,17 @@ def merge_cricket_stats(*dfs):
 
 
 if __name__ == '__main__':
-    the_hundred = pd.read_csv("Data/The_Hunderd/batting_theHundred.csv")
-    the_hundred.drop(['team_id'], axis=1, inplace=True)
-    df1 = the_hundred[the_hundred["team_name"] == "SPVGG Dragons"].reset_index()
-
-    beer_cup = pd.read_csv("Data/Beer_Cup/1397502_batting_leaderboard.csv")
-    beer_cup.drop(['team_id'], axis=1, inplace=True)
-    df2 = beer_cup[beer_cup["team_name"] == "SPVGG Dragons"].reset_index()
-
-    t20 = pd.read_csv("Data/T20/1563884_batting_leaderboard.csv")
-    t20.drop(['team_id'], axis=1, inplace=True)
-    df3 = t20[t20["team_name"] == "SPVGG Dragons"].reset_index()
-
-    trebur_cup = pd.read_csv("Data/Trebur_Cup/1397148_batting_leaderboard.csv")
-    trebur_cup.drop(['team_id'], axis=1, inplace=True)
-    df4 = trebur_cup[trebur_cup["team_name"] == "SPVGG Dragons"].reset_index()
-
-    challengers_cup = pd.read_csv("Data/Challengers_Cup/1423920_batting_leaderboard.csv")
-    challengers_cup.drop(['team_id'], axis=1, inplace=True)
-    df5 = challengers_cup[challengers_cup["team_name"] == "SPVGG Dragons"].reset_index()
-
-    liga = pd.read_csv("Data/Liga/batting_liga.csv")
-    df6 = liga[liga["team_name"] == "SPVGG Dragons"].reset_index()
-
-    rs_cup = pd.read_csv("Data/RS_Cup/batting_rs_cup.csv")
-
-    result = merge_cricket_stats(df1, df2, df3, df4, df5, df6, rs_cup)
-    result.drop(['player_id'], axis=1, inplace=True)
-    result.columns = ["Name", "Team", "Matches", "Innings", "Runs", "Highest", "Average", "Not Outs", "Strike Rate",
-                      "Balls Faced", "Batting Hand", "4s", "6s", "50s", "100s"]
+    # Every tournament export, loose or inside an archive under Data/archives
+    tournaments = all_tournaments()
+    frames = []
+    for tournament in tournaments:
+        df = read_leaderboard(tournament, "batting", tournaments)
+        if df is not None:
+            frames.append(df[df["team_name"].str.strip() == "SPVGG Dragons"])
+
+    result = merge_cricket_stats(*frames, identity=load_identity_map())
+    result.columns = FINAL_COLUMNS
     result.to_csv("final_batting_data.csv", index=False, encoding="utf-8")
+    version = record_snapshot("batting", result)
+    print(f"Recorded batting snapshot v{version}")
     print(result.to_string())
\ No newline at end of file
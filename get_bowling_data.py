@@ -1,11 +1,17 @@
 import pandas as pd
 
-def merge_bowling_stats(*dfs):
+from modules.identity import load_identity_map, resolve_player_ids
+from modules.snapshots import record_snapshot
+from modules.sources import all_tournaments, read_leaderboard
+
+def merge_bowling_stats(*dfs, identity=None):
     """
     Merge multiple bowling DataFrames and calculate cumulative statistics.
 
     Parameters:
         *dfs: Two or more pandas DataFrames with similar structure (bowling stats).
+        identity: Optional identity map (see modules.identity) used to resolve
+                  canonical player ids and names before merging.
 
     Returns:
         A merged and cleaned DataFrame with combined bowling stats.
@@ -28,17 +34,21 @@ def merge_bowling_stats(*dfs):
     def normalize_cols(df):
         df = df.rename(columns=lambda c: c.strip().replace(" ", "_").lower())
         df = df.rename(columns=rename_map)
-        if 'name' in df.columns:
+        if 'name' in df.columns and identity is None:
+            # Names resolved through the identity map are already canonical
             df['name'] = df['name'].astype(str).str.strip().str.replace(r'\s+', ' ', regex=True)
         return df
 
-    dfs = [normalize_cols(df.copy()) for df in dfs]
+    if identity is not None:
+        dfs = [resolve_player_ids(df, identity) for df in dfs]
+    dfs = [normalize_cols(df) for df in dfs]
+    if any('player_id' not in df.columns for df in dfs):
+        raise ValueError("Every dataframe needs a player_id column; pass an identity map to resolve them.")
 
-    # --- Step 2: Merge using player_id if present, else fallback to name ---
+    # --- Step 2: Merge on the integer player_id ---
     merged = dfs[0]
     for i in range(1, len(dfs)):
-        common_keys = [k for k in ['player_id', 'name'] if k in merged.columns and k in dfs[i].columns]
-        merged = pd.merge(merged, dfs[i], on=common_keys, how='outer', suffixes=('', f'_{i}'))
+        merged = pd.merge(merged, dfs[i], on='player_id', how='outer', suffixes=('', f'_{i}'))
 
     # --- Step 3: Numeric columns to sum cumulatively ---
     numeric_cols = [
@@ -56,8 +66,8 @@ def merge_bowling_stats(*dfs):
     if high_cols:
         merged["highest_wickets"] = merged[high_cols].apply(pd.to_numeric, errors='coerce').fillna(0).max(axis=1)
 
-    # --- Step 5: Metadata (team, bowling_style) ---
-    for meta_col in ["team", "bowling_style"]:
+    # --- Step 5: Metadata (name, team, bowling_style) ---
+    for meta_col in ["name", "team", "bowling_style"]:
         col_variants = [c for c in merged.columns if c.startswith(meta_col)]
         if col_variants:
             merged[meta_col] = merged[col_variants].bfill(axis=1).iloc[:, 0].fillna('-')
@@ -113,36 +123,18 @@ def merge_bowling_stats(*dfs):
 
 # === EXAMPLE USAGE ===
 if __name__ == "__main__":
-    # Load CSVs
-    beer_cup = pd.read_csv("Data/Beer_Cup/1397502_bowling_leaderboard.csv")
-    beer_cup.drop(['team_id'], axis=1, inplace=True)
-    df1 = beer_cup[beer_cup["team_name"] == "SPVGG Dragons"]
-
-    challengers_cup = pd.read_csv("Data/Challengers_Cup/1423920_bowling_leaderboard.csv")
-    challengers_cup.drop(['team_id'], axis=1, inplace=True)
-    df2 = challengers_cup[challengers_cup["team_name"] == "SPVGG Dragons"]
-
-    t20 = pd.read_csv("Data/T20/1563884_bowling_leaderboard.csv")
-    t20.drop(['team_id'], axis=1, inplace=True)
-    df3 = t20[t20["team_name"] == "SPVGG Dragons"]
-
-    the_hundred = pd.read_csv("Data/The_Hunderd/bowling_theHundred.csv")
-    the_hundred.drop(['team_id'], axis=1, inplace=True)
-    df4 = the_hundred[the_hundred["team_name"] == "SPVGG Dragons"]
-
-    trebur_cup = pd.read_csv("Data/Trebur_Cup/1397148_bowling_leaderboard.csv")
-    trebur_cup.drop(['team_id'], axis=1, inplace=True)
-    df5 = trebur_cup[trebur_cup["team_name"] == "SPVGG Dragons"]
-
-    liga = pd.read_csv("Data/Liga/bowling_liga.csv")
-    df6 = liga[liga["team_name"] == "SPVGG Dragons"]
-
-    rs_cup = pd.read_csv("Data/RS_Cup/bowling_rs_cup.csv")
-    df7 = rs_cup[rs_cup["team_name"] == "SPVGG Dragons"]
+    # Every tournament export, loose or inside an archive under Data/archives
+    tournaments = all_tournaments()
+    frames = []
+    for tournament in tournaments:
+        df = read_leaderboard(tournament, "bowling", tournaments)
+        if df is not None:
+            frames.append(df[df["team_name"].str.strip() == "SPVGG Dragons"])
 
-    # Merge
-    result = merge_bowling_stats(df1, df2, df3, df4, df5, df6, df7)
+    result = merge_bowling_stats(*frames, identity=load_identity_map())
 
     # Save
     result.to_csv("final_bowling_data.csv", index=False, encoding="utf-8")
+    version = record_snapshot("bowling", result)
+    print(f"Recorded bowling snapshot v{version}")
     print(result.to_string())
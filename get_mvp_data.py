@@ -0,0 +1,69 @@
+import pandas as pd
+
+from modules.identity import load_identity_map, resolve_player_ids
+from modules.snapshots import record_snapshot
+from modules.sources import all_tournaments, read_leaderboard
+
+
+def merge_mvp_stats(*dfs, identity=None):
+    """
+    Merge multiple MVP leaderboard DataFrames and sum the MVP points.
+
+    The MVP exports carry no player_id, so an identity map is needed to
+    resolve one for each row before the tournaments can be combined.
+
+    Parameters:
+        *dfs: Two or more pandas DataFrames with the MVP leaderboard structure.
+        identity: Identity map (see modules.identity); required unless the
+                  frames already have a player_id column.
+
+    Returns:
+        A merged DataFrame with combined MVP points per player.
+    """
+    if len(dfs) < 2:
+        raise ValueError("You must provide at least 2 dataframes.")
+
+    # --- Step 1: Resolve player ids ---
+    if identity is not None:
+        dfs = [resolve_player_ids(df, identity) for df in dfs]
+    if any('player_id' not in df.columns for df in dfs):
+        raise ValueError("Every dataframe needs a player_id column; pass an identity map to resolve them.")
+    stacked = pd.concat(dfs, ignore_index=True)
+
+    # --- Step 2: Metadata from the tournament the player played most in ---
+    stacked = stacked.sort_values("Matches", ascending=False, kind="stable")
+    meta = stacked.groupby("player_id").agg({
+        "Player Name": "first",
+        "Team Name": lambda s: s.str.strip().iloc[0],
+        "Player Role": "first",
+        "Bowling Style": "first",
+        "Batting Hand": "first",
+    })
+
+    # --- Step 3: Sum matches and points ---
+    points = stacked.groupby("player_id")[["Matches", "Batting", "Bowling", "Fielding", "Total"]].sum()
+    final_df = meta.join(points).reset_index()
+    final_df[["Batting", "Bowling", "Fielding", "Total"]] = final_df[["Batting", "Bowling", "Fielding", "Total"]].round(3)
+
+    # --- Step 4: Sort & rename ---
+    final_df = final_df.sort_values(by="Total", ascending=False).reset_index(drop=True)
+    final_df.columns = [
+        "Player ID", "Player Name", "Team", "Player Role", "Bowling Style", "Batting Hand",
+        "Matches", "Batting Points", "Bowling Points", "Fielding Points", "Total Points"
+    ]
+    return final_df
+
+
+if __name__ == '__main__':
+    tournaments = all_tournaments()
+    frames = []
+    for tournament in tournaments:
+        mvp = read_leaderboard(tournament, "mvp", tournaments)
+        if mvp is not None:
+            frames.append(mvp[mvp["Team Name"].str.strip() == "SPVGG Dragons"])
+
+    result = merge_mvp_stats(*frames, identity=load_identity_map())
+    result.to_csv("final_mvp_data.csv", index=False, encoding="utf-8")
+    version = record_snapshot("mvp", result)
+    print(f"Recorded mvp snapshot v{version}")
+    print(result.to_string())
@@ -0,0 +1,15 @@
+import pandas as pd
+
+from modules.percentiles import compute_percentiles
+
+
+if __name__ == '__main__':
+    tables = {
+        "batting": pd.read_csv("final_batting_data.csv"),
+        "bowling": pd.read_csv("final_bowling_data.csv"),
+        "fielding": pd.read_csv("final_fielding_data.csv"),
+        "mvp": pd.read_csv("final_mvp_data.csv"),
+    }
+    result = compute_percentiles(tables).reset_index()
+    result.to_csv("final_percentiles.csv", index=False, encoding="utf-8")
+    print(result.to_string())
@@ -0,0 +1,22 @@
+import os
+
+from modules.identity import build_identity_map, load_identity_map, save_identity_map, IDENTITY_PATH
+from modules.sources import KINDS, all_tournaments, read_leaderboard
+
+
+if __name__ == '__main__':
+    # Every leaderboard, loose or inside an archive, including the MVP files which have no player_id
+    tournaments = all_tournaments()
+    frames = [
+        df for tournament in sorted(tournaments) for kind in KINDS
+        if (df := read_leaderboard(tournament, kind, tournaments)) is not None
+    ]
+
+    existing = load_identity_map()
+    identity = build_identity_map(*frames, existing=existing)
+    save_identity_map(identity)
+
+    n_variants = identity.groupby("player_id")["name_variant"].nunique()
+    print(f"{identity['player_id'].nunique()} players, {len(identity)} name variants "
+          f"({len(identity) - len(existing)} new) written to {os.path.basename(IDENTITY_PATH)}")
+    print(identity[identity["player_id"].isin(n_variants[n_variants > 1].index)].to_string())
@@ -0,0 +1,10 @@
+from modules.cube import build_cube, build_player_facts
+from modules.identity import load_identity_map
+
+
+if __name__ == '__main__':
+    facts = build_player_facts(load_identity_map())
+    cube = build_cube(facts)
+    cube.to_csv("final_rollup_cube.csv", index=False, encoding="utf-8")
+    print(f"{len(facts)} player rows aggregated into {len(cube)} cube cells")
+    print(cube[cube["grouping"] == 0b11101].to_string())
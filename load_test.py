@@ -0,0 +1,400 @@
+import argparse
+import os
+import random
+import shutil
+import sys
+import statistics
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+
+import numpy as np
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+from get_batting_data import FINAL_COLUMNS as BATTING_COLUMNS, merge_cricket_stats
+from get_bowling_data import merge_bowling_stats
+from get_fielding_data import merge_fielding_stats
+from get_mvp_data import merge_mvp_stats
+from modules.percentiles import compute_percentiles
+from modules.cube import build_cube, build_player_facts
+from modules.identity import build_identity_map
+from modules import snapshots
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+PAGES = [
+    "Home.py",
+    "pages/Batting.py",
+    "pages/Bowling.py",
+    "pages/Fielding.py",
+    "pages/Search_Player.py",
+    "pages/Season_Simulator.py",
+    "pages/Team_Selector.py",
+    "pages/Movers.py",
+]
+
+BOWLING_STYLES = [
+    "Right-arm medium", "Right-arm fast", "Left-arm medium", "Left-arm fast",
+    "Right-arm off-break", "Right-arm leg-break", "Slow left-arm orthodox", "-"
+]
+
+PLAYER_ROLES = ["Top-order batter", "Middle-order batter", "All-Rounder", "Bowler", "Wicket-keeper"]
+
+
+def make_tournament(rng, ids, names, team):
+    """
+    Build one synthetic tournament in the raw leaderboard layout of the CSVs under Data/.
+
+    Returns:
+        A dict mapping "batting", "bowling", "fielding" and "mvp" to DataFrames.
+    """
+    n = len(ids)
+    matches = rng.integers(1, 20, n)
+
+    innings = np.minimum(matches, rng.integers(0, 20, n))
+    balls = innings * rng.integers(0, 30, n)
+    runs = (balls * rng.uniform(0.6, 2.0, n)).astype(int)
+    batting = pd.DataFrame({
+        "player_id": ids, "name": names, "team_name": team, "total_match": matches,
+        "innings": innings, "total_runs": runs, "highest_run": np.minimum(runs, rng.integers(0, 120, n)),
+        "not_out": (innings * rng.uniform(0, 0.4, n)).astype(int), "ball_faced": balls,
+        "batting_hand": rng.choice(["RHB", "LHB"], n),
+        "4s": (runs * rng.uniform(0, 0.08, n)).astype(int), "6s": (runs * rng.uniform(0, 0.05, n)).astype(int),
+        "50s": runs // 400, "100s": runs // 1500,
+    })
+
+    balls_bowled = np.minimum(matches, rng.integers(0, 20, n)) * rng.integers(6, 25, n)
+    bowling = pd.DataFrame({
+        "player_id": ids, "name": names, "team_name": team, "total_match": matches,
+        "innings": np.minimum(matches, balls_bowled // 6),
+        "total_wickets": (balls_bowled * rng.uniform(0, 0.12, n)).astype(int), "balls": balls_bowled,
+        "highest_wicket": rng.integers(0, 6, n), "maidens": rng.integers(0, 3, n),
+        "runs": (balls_bowled * rng.uniform(0.8, 2.0, n)).astype(int),
+        "bowling_style": rng.choice(BOWLING_STYLES, n),
+        "overs": balls_bowled // 6 + (balls_bowled % 6) / 10,
+        "dot_balls": (balls_bowled * rng.uniform(0.2, 0.5, n)).astype(int),
+    })
+
+    catches = rng.integers(0, 10, n)
+    caught_behind = np.where(rng.uniform(size=n) < 0.1, rng.integers(0, 20, n), 0)
+    run_outs = rng.integers(0, 3, n)
+    stumpings = np.where(caught_behind > 0, rng.integers(0, 3, n), 0)
+    caught_and_bowled = rng.integers(0, 2, n)
+    fielding = pd.DataFrame({
+        "player_id": ids, "name": names, "team_name": team, "total_match": matches,
+        "catches": catches, "caught_behind": caught_behind, "run_outs": run_outs,
+        "assist_run_outs": rng.integers(0, 2, n), "stumpings": stumpings,
+        "caught_and_bowl": caught_and_bowled, "total_catches": catches + caught_behind + caught_and_bowled,
+        "total_dismissal": catches + caught_behind + run_outs + stumpings + caught_and_bowled,
+    })
+    mvp = pd.DataFrame({
+        "Player Name": names, "Team Name": team, "Player Role": rng.choice(PLAYER_ROLES, n),
+        "Bowling Style": bowling["bowling_style"], "Batting Hand": batting["batting_hand"], "Matches": matches,
+        "Batting": rng.uniform(0, 30, n).round(3), "Bowling": rng.uniform(0, 30, n).round(3),
+        "Fielding": rng.uniform(0, 5, n).round(3),
+    })
+    mvp["Total"] = mvp[["Batting", "Bowling", "Fielding"]].sum(axis=1).round(3)
+    return {"batting": batting, "bowling": bowling, "fielding": fielding, "mvp": mvp}
+
+
+def make_synthetic_data(n_players, seed=0, n_tournaments=3):
+    """
+    Build synthetic final batting/bowling/fielding tables by running synthetic
+    tournaments through the same merge functions as the get_*_data.py scripts.
+
+    Parameters:
+        n_players: Number of players in each data table.
+        seed: Seed for the random generator.
+        n_tournaments: Number of synthetic tournaments merged into the tables.
+
+    Returns:
+        A dict mapping output CSV file names to DataFrames.
+    """
+    rng = np.random.default_rng(seed)
+    ids = np.arange(1_000_000, 1_000_000 + n_players)
+    names = np.array([f"Player {i:06d}" for i in range(n_players)])
+    tournaments = {f"Tournament {i}": make_tournament(rng, ids, names, "SPVGG Dragons") for i in range(n_tournaments)}
+    frames = list(tournaments.values())
+
+    batting = merge_cricket_stats(*[t["batting"] for t in frames])
+    batting.columns = BATTING_COLUMNS
+    bowling = merge_bowling_stats(*[t["bowling"] for t in frames])
+    fielding = merge_fielding_stats(*[t["fielding"] for t in frames])
+
+    identity = build_identity_map(*[df for t in frames for df in t.values()])
+    mvp = merge_mvp_stats(*[t["mvp"] for t in frames], identity=identity)
+    facts = build_player_facts(identity, tournaments, reader=lambda tournament, kind: tournaments[tournament].get(kind))
+
+    return {
+        "final_batting_data.csv": batting,
+        "final_bowling_data.csv": bowling,
+        "final_fielding_data.csv": fielding,
+        "final_rollup_cube.csv": build_cube(facts),
+        "final_mvp_data.csv": mvp,
+        "final_percentiles.csv": compute_percentiles(
+            {"batting": batting, "bowling": bowling, "fielding": fielding, "mvp": mvp}
+        ).reset_index(),
+    }
+
+
+def prepare_workspace(n_players, seed=0):
+    """
+    Copy the dashboard scripts into a temporary directory next to synthetic data,
+    so the load test never touches the real CSVs.
+
+    Returns:
+        Path of the temporary workspace.
+    """
+    workspace = tempfile.mkdtemp(prefix="dragons_load_")
+    shutil.copy(os.path.join(BASE_DIR, "Home.py"), workspace)
+    ignore = shutil.ignore_patterns("__pycache__")
+    shutil.copytree(os.path.join(BASE_DIR, "pages"), os.path.join(workspace, "pages"), ignore=ignore)
+    shutil.copytree(os.path.join(BASE_DIR, "modules"), os.path.join(workspace, "modules"), ignore=ignore)
+
+    data = make_synthetic_data(n_players, seed)
+    for file_name, df in data.items():
+        df.to_csv(os.path.join(workspace, file_name), index=False, encoding="utf-8")
+    seed_snapshots(workspace, {t: data[f"final_{t}_data.csv"] for t in ["batting", "bowling", "fielding", "mvp"]}, seed)
+    return workspace
+
+
+def seed_snapshots(workspace, tables, seed=0):
+    """
+    Record two builds of each leaderboard a week apart in the workspace, so the
+    Movers page compares real versions: the older one has lower stats for a
+    random 30% of the players.
+    """
+    rng = np.random.default_rng(seed)
+    now = pd.Timestamp.now(tz="UTC")
+    snapshot_dir = snapshots.SNAPSHOT_DIR
+    snapshots.SNAPSHOT_DIR = os.path.join(workspace, "snapshots")
+    try:
+        for table, df in tables.items():
+            older = df.copy()
+            behind = rng.random(len(older)) < 0.3
+            for column in older.select_dtypes("number").columns.drop("Player ID"):
+                older.loc[behind, column] = (older.loc[behind, column] * 0.8).round().astype(older[column].dtype)
+            snapshots.record_snapshot(table, older, recorded_at=now - pd.Timedelta(days=8))
+            snapshots.record_snapshot(table, df, recorded_at=now)
+    finally:
+        snapshots.SNAPSHOT_DIR = snapshot_dir
+        snapshots._reconstruct.cache_clear()
+
+
+def init_worker(workspace):
+    """Make a worker process resolve scripts, modules and data from the workspace."""
+    os.chdir(workspace)
+    sys.path.insert(0, workspace)
+    # Forget the repo's modules imported for the data builders, so pages import the workspace copies
+    for name in [m for m in sys.modules if m == "modules" or m.startswith("modules.")]:
+        del sys.modules[name]
+    _player_ids()   # Read once here, so it is not part of any measured rerun
+
+
+@lru_cache(maxsize=1)
+def _player_ids():
+    """Ids of the synthetic players, which the player pickers take as values."""
+    return pd.read_csv("final_batting_data.csv", usecols=["Player ID"])["Player ID"].tolist()
+
+
+def _widget(elements, key):
+    """Return the widget with the given key if it was rendered in the last run."""
+    return next((w for w in elements if w.key == key), None)
+
+
+def interact(at, page, rng):
+    """Apply one realistic user interaction to an AppTest session and rerun it."""
+    if page == "pages/Batting.py" and len(at.slider):
+        at.slider[0].set_value(rng.randint(0, 30))
+    elif page == "pages/Search_Player.py":
+        mode = _widget(at.radio, "mode")
+        if mode is not None:
+            # Most viewers look up one player; some compare a squad
+            mode.set_value("Compare Players" if rng.random() < 0.3 else "Single Player")
+        player = _widget(at.selectbox, "player")
+        if player is not None:
+            player.set_value(rng.choice(_player_ids()))
+            for key in ("view_type", "similar_metric"):
+                radio = _widget(at.radio, key)
+                if radio is not None:
+                    radio.set_value(rng.choice(radio.options))
+            slider = _widget(at.slider, "similar_k")
+            if slider is not None:
+                slider.set_value(rng.randint(1, 10))
+        players = _widget(at.multiselect, "compare_players")
+        if players is not None:
+            players.set_value(rng.sample(_player_ids(), min(len(players.options), rng.randint(2, 20))))
+    elif page == "pages/Season_Simulator.py":
+        # Viewers mostly change the horizon or look at another player; new
+        # inputs are a cache miss and run a fresh simulation
+        action = rng.choice(["matches", "seasons", "player", "player"])
+        if action == "matches":
+            at.slider(key="sim_matches").set_value(rng.randint(1, 30))
+        elif action == "seasons":
+            at.select_slider(key="sim_runs").set_value(rng.choice([5000, 10000, 20000]))
+        else:
+            at.radio(key="sim_stat").set_value(rng.choice(["Runs", "Wickets"]))
+            player = _widget(at.selectbox, "sim_player")
+            if player is not None:
+                player.set_value(rng.choice(player.options))
+    elif page == "pages/Team_Selector.py":
+        # Each change re-solves the selection under the new constraints
+        action = rng.choice(["objective", "bowlers", "matches", "keeper", "unavailable", "overseas"])
+        if action == "objective":
+            at.radio(key="objective").set_value(rng.choice(["Points/Match", "Total Points"]))
+        elif action == "bowlers":
+            at.slider(key="min_bowlers").set_value(rng.randint(0, 8))
+        elif action == "matches":
+            at.slider(key="min_matches").set_value(rng.randint(0, 10))
+        elif action == "keeper":
+            at.checkbox(key="require_keeper").set_value(rng.random() < 0.8)
+        else:
+            at.multiselect(key=action).set_value(rng.sample(_player_ids(), rng.randint(0, 6)))
+    elif page == "pages/Movers.py":
+        # Switch leaderboard, or compare the two seeded builds the other way round
+        board = at.radio(key="movers_board")
+        board.set_value(rng.choice(board.options))
+        if rng.random() < 0.2:
+            at.selectbox(key="movers_from").set_value(2)
+            at.selectbox(key="movers_to").set_value(1)
+        else:
+            at.selectbox(key="movers_from").set_value(1)
+            at.selectbox(key="movers_to").set_value(2)
+    at.run()
+
+
+def _timed_out(error):
+    """Whether AppTest gave up on a rerun that exceeded its timeout."""
+    return isinstance(error, RuntimeError) and "timed out" in str(error)
+
+
+def run_session(workspace, page, n_interactions, seed, timeout):
+    """
+    Drive one simulated viewer through a page.
+
+    A rerun that exceeds the timeout counts as an error at the latency it took;
+    the viewer then reloads the page, as the half-rendered one cannot be used.
+
+    Returns:
+        A list of rerun latencies in seconds, the number of script errors
+        (timeouts included) and the number of timeouts.
+    """
+    rng = random.Random(seed)
+    at = None
+    latencies = []
+    errors = timeouts = 0
+
+    for _ in range(n_interactions + 1):
+        if at is None:
+            at = AppTest.from_file(os.path.join(workspace, page), default_timeout=timeout)
+            rerun = at.run
+        else:
+            rerun = partial(interact, at, page, rng)
+        start = time.perf_counter()
+        try:
+            rerun()
+            errors += len(at.exception)
+        except RuntimeError as e:
+            if not _timed_out(e):
+                raise
+            at = None
+            errors += 1
+            timeouts += 1
+        latencies.append(time.perf_counter() - start)
+    return latencies, errors, timeouts
+
+
+def measure_memory(workspace, page, timeout):
+    """
+    Measure the peak Python heap allocated by a single rerun of a page,
+    in isolation so concurrent sessions do not skew the number.
+
+    Returns:
+        Peak traced memory in MB, or NaN if the page timed out.
+    """
+    at = AppTest.from_file(os.path.join(workspace, page), default_timeout=timeout)
+    try:
+        at.run()  # Warm-up: imports and caches are not part of the per-rerun cost
+        tracemalloc.start()
+        try:
+            interact(at, page, random.Random(0))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except RuntimeError as e:
+        if not _timed_out(e):
+            raise
+        return float("nan")
+    return peak / 1024 ** 2
+
+
+def load_test(sessions=20, interactions=10, players=5000, pages=None, seed=0, timeout=60):
+    """
+    Run N concurrent simulated sessions against each dashboard page.
+
+    Parameters:
+        sessions: Number of concurrent sessions per page.
+        interactions: Number of interactions each session performs after its first run.
+        players: Number of synthetic players in each data table.
+        pages: Page scripts to test, relative to the repo root (defaults to all pages).
+        seed: Seed for data generation and interactions.
+        timeout: Per-rerun timeout in seconds.
+
+    Returns:
+        A DataFrame with one row per page: latency percentiles, errors (and how
+        many of them were timeouts) and memory.
+    """
+    pages = pages or PAGES
+    workspace = prepare_workspace(players, seed)
+    try:
+        rows = []
+        for page in pages:
+            # AppTest swaps process-global runtime state on every run, so each
+            # simulated viewer gets its own worker process
+            with ProcessPoolExecutor(max_workers=sessions, initializer=init_worker, initargs=(workspace,)) as pool:
+                futures = [
+                    pool.submit(run_session, workspace, page, interactions, seed + i, timeout)
+                    for i in range(sessions)
+                ]
+                start = time.perf_counter()
+                results = [f.result() for f in futures]
+                wall = time.perf_counter() - start
+
+            # Measured in a fresh worker: running AppTest in this process would replace __main__
+            with ProcessPoolExecutor(max_workers=1, initializer=init_worker, initargs=(workspace,)) as pool:
+                peak_mem = pool.submit(measure_memory, workspace, page, timeout).result()
+
+            latencies = np.array([lat for lats, _, _ in results for lat in lats]) * 1000
+            rows.append({
+                "page": page,
+                "sessions": sessions,
+                "reruns": len(latencies),
+                "errors": sum(err for _, err, _ in results),
+                "timeouts": sum(timeouts for _, _, timeouts in results),
+                "p50_ms": round(float(np.percentile(latencies, 50)), 1),
+                "p95_ms": round(float(np.percentile(latencies, 95)), 1),
+                "p99_ms": round(float(np.percentile(latencies, 99)), 1),
+                "mean_ms": round(statistics.fmean(latencies), 1),
+                "reruns_per_s": round(len(latencies) / wall, 1),
+                "peak_mem_mb": round(peak_mem, 1),
+            })
+        return pd.DataFrame(rows)
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for the dashboard pages.")
+    parser.add_argument("--sessions", type=int, default=20, help="concurrent sessions per page")
+    parser.add_argument("--interactions", type=int, default=10, help="interactions per session")
+    parser.add_argument("--players", type=int, default=5000, help="synthetic players per table")
+    parser.add_argument("--pages", nargs="*", help="page scripts to test (default: all)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=60, help="per-rerun timeout in seconds")
+    args = parser.parse_args()
+
+    report = load_test(args.sessions, args.interactions, args.players, args.pages, args.seed, args.timeout)
+    print(report.to_string(index=False))
@@ -0,0 +1,174 @@
+# modules/cube.py
+from functools import partial
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from modules.identity import resolve_player_ids
+from modules.sources import all_tournaments, read_leaderboard
+
+ALL = "(All)"
+DIMENSIONS = ["team", "tournament", "batting_hand", "bowling_style", "player_role"]
+
+# Additive measures, summed over players
+SUM_MEASURES = [
+    "runs", "balls_faced", "4s", "6s", "innings_batted", "not_outs",
+    "wickets", "balls_bowled", "runs_conceded", "maidens",
+    "catches", "caught_behind", "run_outs", "stumpings", "dismissals", "mvp_points",
+]
+# Distinct player counts; computed per grouping set, so never summed across rows
+COUNT_MEASURES = ["players", "batters", "bowlers"]
+
+_KIND_COLUMNS = {
+    "batting": {"total_match": "matches", "innings": "innings_batted", "total_runs": "runs",
+                "ball_faced": "balls_faced", "not_out": "not_outs", "4s": "4s", "6s": "6s",
+                "batting_hand": "batting_hand"},
+    "bowling": {"total_match": "matches", "total_wickets": "wickets", "balls": "balls_bowled",
+                "runs": "runs_conceded", "maidens": "maidens", "bowling_style": "bowling_style"},
+    "fielding": {"total_match": "matches", "catches": "catches", "caught_behind": "caught_behind",
+                 "run_outs": "run_outs", "stumpings": "stumpings", "total_dismissal": "dismissals"},
+    "mvp": {"Matches": "matches", "Total": "mvp_points", "Player Role": "player_role",
+            "Batting Hand": "mvp_batting_hand", "Bowling Style": "mvp_bowling_style"},
+}
+
+
+def build_player_facts(identity, tournaments=None, reader=read_leaderboard):
+    """
+    Build the player × tournament fact table behind the rollup cube.
+
+    Parameters:
+        identity: Identity map used to give every row (including MVP rows) an integer player_id.
+        tournaments: Tournament names to include (defaults to all_tournaments(), archives included).
+        reader: Callable (tournament, kind) -> DataFrame or None, defaults to the raw exports.
+
+    Returns:
+        A DataFrame with one row per player, team and tournament.
+    """
+    if reader is read_leaderboard:
+        # Resolve the sources once, not on every read
+        sources = all_tournaments()
+        reader = partial(read_leaderboard, tournaments=sources)
+        tournaments = tournaments or sources
+    elif tournaments is None:
+        tournaments = all_tournaments()
+
+    frames = []
+    for tournament in tournaments:
+        facts = None
+        for kind, columns in _KIND_COLUMNS.items():
+            df = reader(tournament, kind)
+            if df is None:
+                continue
+            df = resolve_player_ids(df, identity)
+            team_col = "team_name" if "team_name" in df.columns else "Team Name"
+            part = df[list(columns)].rename(columns=columns).assign(
+                player_id=df["player_id"].to_numpy(),
+                team=df[team_col].astype(str).str.strip().to_numpy(),
+            )
+            part = part.rename(columns={"matches": f"matches_{kind}"})
+            part = part.groupby(["player_id", "team"], as_index=False).first()
+            facts = part if facts is None else facts.merge(part, on=["player_id", "team"], how="outer")
+        facts["tournament"] = tournament
+        frames.append(facts)
+
+    facts = pd.concat(frames, ignore_index=True)
+    # Tournaments without a given export (e.g. no MVP file) leave its columns empty
+    expected = [c for columns in _KIND_COLUMNS.values() for c in columns.values() if c != "matches"]
+    facts = facts.reindex(columns=list(dict.fromkeys(list(facts.columns) + expected)))
+    match_cols = [c for c in facts.columns if c.startswith("matches_")]
+    facts["matches"] = facts[match_cols].max(axis=1)
+    facts["batting_hand"] = facts["batting_hand"].fillna(facts["mvp_batting_hand"])
+    facts["bowling_style"] = facts["bowling_style"].fillna(facts["mvp_bowling_style"])
+    for dim in DIMENSIONS:
+        facts[dim] = facts[dim].fillna("-").replace("", "-")
+    for col in SUM_MEASURES + ["matches"]:
+        facts[col] = pd.to_numeric(facts[col], errors="coerce").fillna(0)
+
+    return facts[["player_id"] + DIMENSIONS + ["matches"] + SUM_MEASURES]
+
+
+def build_cube(facts):
+    """
+    Aggregate the fact table over every grouping set of DIMENSIONS (a full CUBE),
+    so that any slice, subtotal or grand total is a single precomputed row.
+
+    Parameters:
+        facts: Output of build_player_facts.
+
+    Returns:
+        A DataFrame with the DIMENSIONS (rolled-up dimensions hold ALL),
+        a 'grouping' bitmask of the rolled-up dimensions and the measures.
+    """
+    facts = facts.assign(
+        batter_id=facts["player_id"].where(facts["balls_faced"] > 0),
+        bowler_id=facts["player_id"].where(facts["balls_bowled"] > 0),
+    )
+    aggregations = {col: (col, "sum") for col in SUM_MEASURES}
+    aggregations.update(players=("player_id", "nunique"),
+                        batters=("batter_id", "nunique"),
+                        bowlers=("bowler_id", "nunique"))
+
+    parts = []
+    for n in range(len(DIMENSIONS) + 1):
+        for group in combinations(DIMENSIONS, n):
+            # The empty grouping set (grand total) groups on a constant key
+            keys = list(group) or np.zeros(len(facts), dtype=np.int8)
+            part = facts.groupby(keys).agg(**aggregations)
+            part = part.reset_index() if group else part.reset_index(drop=True)
+            rolled_up = [d for d in DIMENSIONS if d not in group]
+            part = part.assign(**{d: ALL for d in rolled_up})
+            part["grouping"] = sum(1 << i for i, d in enumerate(DIMENSIONS) if d in rolled_up)
+            parts.append(part)
+
+    cube = pd.concat(parts, ignore_index=True)
+    int_cols = [c for c in SUM_MEASURES if c != "mvp_points"] + COUNT_MEASURES
+    cube[int_cols] = cube[int_cols].astype(np.int64)
+    cube["mvp_points"] = cube["mvp_points"].astype(float).round(3)
+    return cube[["grouping"] + DIMENSIONS + SUM_MEASURES + COUNT_MEASURES]
+
+
+def index_cube(cube):
+    """Index the cube by (grouping, *DIMENSIONS) so slices become sorted-index lookups."""
+    return cube.set_index(["grouping"] + DIMENSIONS).sort_index()
+
+
+def cube_slice(cube, by=(), **filters):
+    """
+    Look up a slice of the cube without aggregating anything.
+
+    Parameters:
+        cube: Output of index_cube.
+        by: Dimensions to break the result down by (one row per value).
+        **filters: Dimension values to fix, e.g. team="SPVGG Dragons".
+                   Every dimension not in `by` or `filters` is rolled up.
+
+    Returns:
+        A DataFrame with one row per combination of the `by` dimensions,
+        with those dimensions as columns.
+
+    Example:
+        cube_slice(cube, by=["bowling_style"], team="SPVGG Dragons")
+    """
+    unknown = set(filters) - set(DIMENSIONS) | set(by) - set(DIMENSIONS)
+    if unknown:
+        raise ValueError(f"Unknown cube dimensions: {sorted(unknown)}")
+
+    grouping = sum(1 << i for i, d in enumerate(DIMENSIONS) if d not in by and d not in filters)
+    key = (grouping,) + tuple(
+        slice(None) if d in by else filters.get(d, ALL) for d in DIMENSIONS
+    )
+    try:
+        # A fully fixed key selects one row; wrap it so .loc still returns a frame
+        result = cube.loc[key, :] if by else cube.loc[[key]]
+    except KeyError:
+        return pd.DataFrame(columns=list(by) + list(cube.columns))
+    return result.reset_index()[list(by) + list(cube.columns)]
+
+
+def cube_totals(cube, **filters):
+    """Return the single cube row for a fully fixed slice as a Series (zeros if empty)."""
+    result = cube_slice(cube, **filters)
+    if result.empty:
+        return pd.Series(0, index=cube.columns)
+    return result.iloc[0]
@@ -0,0 +1,147 @@
+# modules/data_loader.py
+import hashlib
+import os
+from functools import lru_cache
+
+import pandas as pd
+
+from modules.cube import index_cube
+from modules.similarity import build_profile_matrix
+
+# With copy-on-write, frames derived from a cached table (slices, assign, shallow
+# copies) never write into the cached data, so callers don't need df.copy().
+pd.set_option("mode.copy_on_write", True)
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DATA_FILES = {
+    "batting": "final_batting_data.csv",
+    "bowling": "final_bowling_data.csv",
+    "fielding": "final_fielding_data.csv",
+    "cube": "final_rollup_cube.csv",
+    "mvp": "final_mvp_data.csv",
+    "percentiles": "final_percentiles.csv",
+}
+
+
+@lru_cache(maxsize=16)
+def _read_table(path, mtime):
+    # mtime is part of the cache key so a rebuilt CSV is picked up on the next rerun
+    return pd.read_csv(path)
+
+
+def dataset_version():
+    """
+    Identify the current build of the data tables.
+
+    Returns:
+        A (version, last_modified) tuple: a short hash that changes whenever any
+        table is rebuilt, and the newest modification time as a Unix timestamp.
+    """
+    stats = [os.stat(data_path(name)) for name in sorted(DATA_FILES)]
+    signature = ";".join(f"{name}:{st.st_mtime_ns}:{st.st_size}" for name, st in zip(sorted(DATA_FILES), stats))
+    version = hashlib.sha1(signature.encode("utf-8")).hexdigest()[:16]
+    return version, max(st.st_mtime for st in stats)
+
+
+def data_path(name):
+    """Return the absolute path of a built data table."""
+    return os.path.join(BASE_DIR, DATA_FILES[name])
+
+
+def load_table(name):
+    """
+    Load one of the built data tables (a key of DATA_FILES, e.g. "batting").
+
+    The CSV is parsed once per process and shared by every session. Each call
+    returns a shallow copy: with copy-on-write enabled, any modification made by
+    the caller copies only the touched columns and never reaches the shared frame.
+
+    Parameters:
+        name: Key of the table in DATA_FILES.
+
+    Returns:
+        A pandas DataFrame.
+    """
+    path = data_path(name)
+    return _read_table(path, os.path.getmtime(path)).copy(deep=False)
+
+
+@lru_cache(maxsize=16)
+def _indexed_table(path, mtime, key):
+    return _read_table(path, mtime).set_index(key, drop=False)
+
+
+def load_indexed(name, key="Player ID"):
+    """
+    Load a built data table indexed by `key`, for batched lookups such as
+    load_indexed("batting").reindex(player_ids). The index is built once per process.
+    """
+    path = data_path(name)
+    return _indexed_table(path, os.path.getmtime(path), key).copy(deep=False)
+
+
+@lru_cache(maxsize=4)
+def _indexed_cube(path, mtime):
+    return index_cube(_read_table(path, mtime))
+
+
+def load_cube():
+    """
+    Load the team × tournament × role rollup cube, indexed for modules.cube.cube_slice.
+
+    Like load_table, the indexed cube is built once per process and shared.
+    """
+    path = data_path("cube")
+    return _indexed_cube(path, os.path.getmtime(path)).copy(deep=False)
+
+
+@lru_cache(maxsize=4)
+def _profiles(mtimes):
+    tables = [_read_table(data_path(name), mtime) for name, mtime in mtimes]
+    players, matrix = build_profile_matrix(*tables)
+    matrix.flags.writeable = False
+    return players, matrix
+
+
+def load_profiles():
+    """
+    Load the player similarity profiles (see modules.similarity.build_profile_matrix).
+
+    The feature matrix is built once per process from the batting, bowling,
+    fielding and MVP tables, rebuilt when any of them changes, and shared read-only.
+
+    Returns:
+        A (players, matrix) tuple.
+    """
+    names = ["batting", "bowling", "fielding", "mvp"]
+    return _profiles(tuple((name, os.path.getmtime(data_path(name))) for name in names))
+
+
+@lru_cache(maxsize=4)
+def _player_directory(mtimes):
+    batting, bowling, fielding = (_read_table(data_path(name), mtime) for name, mtime in mtimes)
+    directory = pd.concat([
+        batting[["Player ID", "Name"]].rename(columns={"Name": "Player Name"}),
+        bowling[["Player ID", "Player Name"]],
+        fielding[["Player ID", "Player Name"]],
+    ]).dropna().drop_duplicates("Player ID").sort_values(["Player Name", "Player ID"])
+    shared = directory["Player Name"].duplicated(keep=False)
+    directory["Label"] = directory["Player Name"].where(
+        ~shared, directory["Player Name"] + " (#" + directory["Player ID"].astype(str) + ")"
+    )
+    return directory.set_index("Player ID")
+
+
+def load_player_directory():
+    """
+    Load every player of the batting, bowling and fielding tables, sorted by name.
+
+    Pickers select players by id; the Label column is what they show, the name
+    with the id appended when several players share it.
+
+    Returns:
+        A DataFrame indexed by Player ID with Player Name and Label columns.
+    """
+    names = ["batting", "bowling", "fielding"]
+    return _player_directory(tuple((name, os.path.getmtime(data_path(name))) for name in names)).copy(deep=False)
@@ -0,0 +1,245 @@
+# modules/identity.py
+import os
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IDENTITY_PATH = os.path.join(BASE_DIR, "player_identity.csv")
+
+IDENTITY_COLUMNS = ["player_id", "name", "name_variant", "team_name", "name_key", "team_key"]
+
+TRIGRAM_DIM = 256   # Hashed character-trigram buckets per name vector
+MAX_BLOCK = 500     # Blocks bigger than this are too generic to be useful for matching
+MATCH_THRESHOLD = 0.8
+
+
+def normalize_names(names):
+    """
+    Vectorized name normalization used as the matching key: ASCII-folded,
+    lower-case, letters and digits only, single spaces.
+    """
+    return (
+        names.astype(str)
+        .str.normalize("NFKD").str.encode("ascii", "ignore").str.decode("ascii")
+        .str.lower()
+        .str.replace(r"[^a-z0-9]+", " ", regex=True)
+        .str.strip()
+    )
+
+
+def _standardize(df):
+    """Return a frame with raw 'name', 'team_name' and (possibly missing) 'player_id' columns."""
+    df = df.rename(columns=lambda c: c.strip().replace(" ", "_").lower())
+    df = df.rename(columns={"player_name": "name", "team": "team_name"})
+    out = pd.DataFrame({
+        "name": df["name"].astype(str).str.strip().str.replace(r"\s+", " ", regex=True),
+        "team_name": df["team_name"].astype(str).str.strip() if "team_name" in df.columns else "",
+    })
+    out["player_id"] = pd.to_numeric(df["player_id"], errors="coerce") if "player_id" in df.columns else np.nan
+    return out
+
+
+def _trigram_vectors(keys):
+    """L2-normalized hashed character-trigram vectors for an array of ASCII keys."""
+    keys = pd.Series(keys, dtype=object)
+    if keys.empty:
+        return np.zeros((0, TRIGRAM_DIM), dtype=np.float32)
+    padded = " " + keys + " "
+    lengths = padded.str.len().to_numpy()
+    width = int(lengths.max())
+    chars = np.frombuffer(
+        "".join(padded.str.pad(width, side="right")).encode("ascii"), dtype=np.uint8
+    ).reshape(len(keys), width).astype(np.int64)
+
+    codes = (chars[:, :-2] * 131 + chars[:, 1:-1]) * 131 + chars[:, 2:]
+    rows, cols = np.nonzero(np.arange(width - 2) < (lengths - 2)[:, None])
+    vectors = np.zeros((len(keys), TRIGRAM_DIM), dtype=np.float32)
+    np.add.at(vectors, (rows, codes[rows, cols] % TRIGRAM_DIM), 1.0)
+    vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-9)
+    return vectors
+
+
+def _blocks(team_keys, name_keys):
+    """Blocking keys: same team and a shared 3-letter token prefix. Indexed by row position."""
+    tokens = pd.Series(name_keys).str.split().explode().dropna()
+    teams = pd.Series(team_keys).iloc[tokens.index].to_numpy()
+    return pd.Series(teams + "|" + tokens.str[:3].to_numpy(), index=tokens.index)
+
+
+def _best_matches(query, reference, threshold=MATCH_THRESHOLD, exclude_self=False):
+    """
+    Find the most similar reference row for each query row, comparing only pairs
+    that share a block, so the cost grows with block sizes rather than n².
+
+    Parameters:
+        query, reference: Frames with 'team_key' and 'name_key' columns.
+        threshold: Minimum cosine similarity of trigram vectors to accept a match.
+        exclude_self: Only consider reference rows before the query row (self-matching).
+
+    Returns:
+        A Series mapping query positions to reference positions.
+    """
+    if query.empty or reference.empty:
+        return pd.Series(dtype=np.int64)
+
+    q_blocks = _blocks(query["team_key"].to_numpy(), query["name_key"].to_numpy())
+    r_blocks = _blocks(reference["team_key"].to_numpy(), reference["name_key"].to_numpy())
+    block_sizes = r_blocks.value_counts()
+    r_blocks = r_blocks[r_blocks.map(block_sizes) <= MAX_BLOCK]
+
+    pairs = pd.merge(
+        pd.DataFrame({"block": q_blocks.to_numpy(), "q": q_blocks.index}),
+        pd.DataFrame({"block": r_blocks.to_numpy(), "r": r_blocks.index}),
+        on="block",
+    )[["q", "r"]].drop_duplicates()
+    if exclude_self:
+        pairs = pairs[pairs["r"] < pairs["q"]]
+    if pairs.empty:
+        return pd.Series(dtype=np.int64)
+
+    q_vec = _trigram_vectors(query["name_key"].to_numpy())
+    r_vec = _trigram_vectors(reference["name_key"].to_numpy())
+    q_idx, r_idx = pairs["q"].to_numpy(), pairs["r"].to_numpy()
+    pairs = pairs.assign(score=np.einsum("ij,ij->i", q_vec[q_idx], r_vec[r_idx]))
+
+    pairs = pairs[pairs["score"] >= threshold]
+    best = pairs.sort_values("score", ascending=False).drop_duplicates("q")
+    return pd.Series(best["r"].to_numpy(), index=best["q"].to_numpy())
+
+
+def _empty_identity_map():
+    # Typed, so merging it with observed ids works before anything has been mapped
+    return pd.DataFrame(columns=IDENTITY_COLUMNS).astype({"player_id": np.int64})
+
+
+def load_identity_map(path=IDENTITY_PATH):
+    """Load the persisted identity map, or an empty one if it has not been built yet."""
+    if not os.path.exists(path):
+        return _empty_identity_map()
+    return pd.read_csv(path, keep_default_na=False, dtype={"player_id": np.int64})
+
+
+def build_identity_map(*dfs, existing=None, threshold=MATCH_THRESHOLD):
+    """
+    Build or extend the player identity map (canonical player_id ↔ name variants).
+
+    Rows carrying a player_id register their spelling as a variant of that id.
+    Rows without one (e.g. the MVP leaderboards) are matched on the normalized
+    name within the same team, first exactly and then by trigram similarity over
+    a blocking index. Anything left gets a new negative synthetic id.
+
+    Parameters:
+        *dfs: Raw leaderboard DataFrames (player_id is optional).
+        existing: A previously built identity map to extend.
+        threshold: Minimum similarity for a fuzzy match.
+
+    Returns:
+        The identity map DataFrame, one row per (player_id, name variant, team).
+    """
+    identity = existing if existing is not None else _empty_identity_map()
+    obs = pd.concat([_standardize(df) for df in dfs], ignore_index=True)
+    obs = obs.rename(columns={"name": "name_variant"})
+
+    # Only spellings that are not in the map yet need normalizing and matching
+    known = identity[["player_id", "name_variant", "team_name"]]
+    with_id = obs[obs["player_id"].notna()].drop_duplicates(["player_id", "name_variant", "team_name"])
+    with_id = with_id.merge(known, on=["player_id", "name_variant", "team_name"], how="left", indicator=True)
+    with_id = with_id[with_id["_merge"] == "left_only"].drop(columns="_merge")
+
+    new_rows = with_id.assign(player_id=with_id["player_id"].astype(np.int64))
+    new_rows = new_rows.assign(name_key=normalize_names(new_rows["name_variant"]),
+                               team_key=normalize_names(new_rows["team_name"]))
+    reference = pd.concat([identity, new_rows], ignore_index=True)
+
+    known = reference[["name_variant", "team_name"]].drop_duplicates()
+    no_id = obs[obs["player_id"].isna()].drop(columns="player_id").drop_duplicates(["name_variant", "team_name"])
+    no_id = no_id.merge(known, on=["name_variant", "team_name"], how="left", indicator=True)
+    no_id = no_id[no_id["_merge"] == "left_only"].drop(columns="_merge")
+
+    if not no_id.empty:
+        no_id = no_id.reset_index(drop=True)
+        no_id = no_id.assign(name_key=normalize_names(no_id["name_variant"]),
+                             team_key=normalize_names(no_id["team_name"]))
+
+        # Step 1: exact key match ignoring spaces ("Rohit.Cric" == "RohitCric"),
+        # only when the key is unambiguous within the team
+        keys = reference.assign(compact_key=reference["name_key"].str.replace(" ", "", regex=False))
+        keys = keys.drop_duplicates(["team_key", "compact_key", "player_id"])
+        keys = keys[~keys.duplicated(["team_key", "compact_key"], keep=False)]
+        no_id["compact_key"] = no_id["name_key"].str.replace(" ", "", regex=False)
+        no_id = no_id.merge(keys[["team_key", "compact_key", "player_id"]], on=["team_key", "compact_key"], how="left")
+        no_id = no_id.drop(columns="compact_key")
+
+        # Step 2: fuzzy match against known spellings in the same team
+        todo = no_id[no_id["player_id"].isna()]
+        ref = reference.reset_index(drop=True)
+        matches = _best_matches(todo.reset_index(drop=True), ref, threshold)
+        no_id.loc[todo.index[matches.index], "player_id"] = ref["player_id"].to_numpy()[matches.to_numpy()]
+
+        # Step 3: new players; near-duplicate spellings among them share one id
+        todo = no_id[no_id["player_id"].isna()].drop_duplicates(["team_key", "name_key"])
+        todo_pos = todo.reset_index(drop=True)
+        first_id = min(0, int(reference["player_id"].min()) if len(reference) else 0) - 1
+        new_ids = first_id - np.arange(len(todo_pos))
+        same = _best_matches(todo_pos, todo_pos, threshold, exclude_self=True)
+        for q, r in sorted(same.items()):
+            new_ids[q] = new_ids[r]
+        todo = todo.assign(new_id=new_ids)
+        no_id = no_id.merge(todo[["team_key", "name_key", "new_id"]], on=["team_key", "name_key"], how="left")
+        no_id["player_id"] = no_id["player_id"].astype(float).fillna(no_id["new_id"]).astype(np.int64)
+        reference = pd.concat([reference, no_id.drop(columns="new_id")], ignore_index=True)
+
+    # Canonical name: the most common spelling seen with the id
+    reference["player_id"] = reference["player_id"].astype(np.int64)
+    counts = obs.groupby(["player_id", "name_variant"]).size().rename("n").reset_index()
+    canonical = (
+        reference.merge(counts, on=["player_id", "name_variant"], how="left")
+        .fillna({"n": 0})
+        .sort_values("n", ascending=False, kind="stable")
+        .drop_duplicates("player_id")
+        .set_index("player_id")["name_variant"]
+    )
+    # Ids already in the map keep their canonical name
+    canonical.update(identity.drop_duplicates("player_id").set_index("player_id")["name"])
+    reference["name"] = reference["player_id"].map(canonical)
+
+    return reference[IDENTITY_COLUMNS].sort_values(["player_id", "name_variant"]).reset_index(drop=True)
+
+
+def save_identity_map(identity, path=IDENTITY_PATH):
+    """Persist the identity map next to the built data tables."""
+    identity.to_csv(path, index=False, encoding="utf-8")
+
+
+def resolve_player_ids(df, identity):
+    """
+    Attach canonical integer player ids and names to a raw leaderboard frame.
+
+    Rows that already carry a player_id keep it; rows without one are looked up by
+    their exact (name, team) spelling, which the identity map registers for every
+    observed variant, so no normalization runs here.
+
+    Parameters:
+        df: Raw or column-normalized leaderboard DataFrame.
+        identity: The map returned by build_identity_map / load_identity_map.
+
+    Returns:
+        A new DataFrame with integer 'player_id' and canonical 'name' columns.
+    """
+    std = _standardize(df)
+    if std["player_id"].isna().any():
+        lookup = identity.drop_duplicates(["name_variant", "team_name"]).set_index(["name_variant", "team_name"])["player_id"]
+        missing = std["player_id"].isna()
+        keys = pd.MultiIndex.from_frame(std.loc[missing, ["name", "team_name"]])
+        std.loc[missing, "player_id"] = lookup.reindex(keys).to_numpy()
+        if std["player_id"].isna().any():
+            unknown = std.loc[std["player_id"].isna(), "name"].tolist()
+            raise ValueError(f"Players missing from the identity map, rebuild it first: {unknown}")
+
+    player_ids = std["player_id"].astype(np.int64).to_numpy()
+    canonical = identity.drop_duplicates("player_id").set_index("player_id")["name"]
+    names = pd.Series(player_ids).map(canonical).fillna(std["name"].reset_index(drop=True)).to_numpy()
+
+    name_col = "Player Name" if "Player Name" in df.columns else "name"
+    return df.assign(player_id=player_ids, **{name_col: names})
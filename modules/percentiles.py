@@ -0,0 +1,54 @@
+# modules/percentiles.py
+import pandas as pd
+
+# (table, source column, percentile column, higher_is_better)
+PERCENTILE_METRICS = [
+    ("batting", "Runs", "Runs", True),
+    ("batting", "Average", "Batting Average", True),
+    ("batting", "Strike Rate", "Batting Strike Rate", True),
+    ("batting", "Boundary %", "Boundary %", True),
+    ("batting", "Conversion Rate", "Conversion Rate", True),
+    ("bowling", "Wickets", "Wickets", True),
+    ("bowling", "Economy", "Economy", False),
+    ("bowling", "Average", "Bowling Average", False),
+    ("bowling", "Strike Rate", "Bowling Strike Rate", False),
+    ("fielding", "Total Dismissals", "Dismissals", True),
+    ("fielding", "Dismissals/Match", "Dismissals/Match", True),
+    ("mvp", "Total Points", "MVP Points", True),
+]
+
+# Bowling averages and strike rates of 0 mean "no wickets", not "perfect"
+_ZERO_IS_MISSING = {("bowling", "Average"), ("bowling", "Strike Rate")}
+
+
+def compute_percentiles(tables):
+    """
+    Rank every player against the whole population for each comparison metric.
+
+    Parameters:
+        tables: Dict with the final "batting", "bowling", "fielding" and "mvp" tables.
+
+    Returns:
+        A DataFrame indexed by Player ID with the player's name and a 0-100
+        percentile column per metric (100 = best). Players without a value for
+        a metric (e.g. bowling metrics of a batter) are left missing rather
+        than ranked last.
+    """
+    names = pd.concat([
+        tables["batting"].set_index("Player ID")["Name"],
+        tables["bowling"].set_index("Player ID")["Player Name"],
+        tables["fielding"].set_index("Player ID")["Player Name"],
+        tables["mvp"].set_index("Player ID")["Player Name"],
+    ], axis=1).bfill(axis=1).iloc[:, 0]
+
+    columns = {}
+    for table, source, name, higher_is_better in PERCENTILE_METRICS:
+        values = tables[table].set_index("Player ID")[source].astype(float)
+        if (table, source) in _ZERO_IS_MISSING:
+            values = values.where(values > 0)
+        columns[name] = values.rank(pct=True, ascending=higher_is_better, method="max") * 100
+
+    percentiles = pd.concat(columns, axis=1).round(1)
+    percentiles.insert(0, "Player Name", names.reindex(percentiles.index))
+    percentiles.index.name = "Player ID"
+    return percentiles
@@ -0,0 +1,83 @@
+# modules/player_compare.py
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from modules.data_loader import load_indexed
+from modules.percentiles import PERCENTILE_METRICS
+
+MAX_PLAYERS = 20
+
+COMPARE_COLUMNS = {
+    "batting": ["Matches", "Innings", "Runs", "Average", "Strike Rate", "Boundary %", "50s"],
+    "bowling": ["Overs Bowled", "Wickets", "Economy", "Average", "Strike Rate"],
+    "fielding": ["Catches", "Caught Behind", "Run Outs", "Stumpings", "Total Dismissals"],
+}
+
+
+def show_player_comparison(directory):
+    st.subheader("⚔️ Head-to-Head Comparison")
+
+    # Players are picked by id (see load_player_directory), names are only labels
+    options = list(directory.index)
+    selected = st.multiselect(
+        f"Select up to {MAX_PLAYERS} players",
+        options=options,
+        default=options[:2],
+        format_func=directory["Label"].get,
+        max_selections=MAX_PLAYERS,
+        key="compare_players",
+    )
+    if len(selected) < 2:
+        st.info("Pick at least two players to compare.")
+        return
+
+    # One indexed batch lookup per table instead of a mask scan per player and table
+    percentiles = load_indexed("percentiles").reindex(selected).dropna(subset=["Player ID"])
+    player_ids = percentiles.index.tolist()
+    percentiles = percentiles.assign(Player=directory["Label"].reindex(player_ids).to_numpy())
+
+    # --- Percentile radar ---
+    metrics = [name for _, _, name, _ in PERCENTILE_METRICS]
+    long_df = percentiles[["Player"] + metrics].melt(
+        id_vars="Player", var_name="Metric", value_name="Percentile"
+    )
+    st.header("🕸️ Percentile Profile")
+    fig_radar = px.line_polar(
+        long_df,
+        r="Percentile",
+        theta="Metric",
+        color="Player",
+        line_close=True,
+        range_r=[0, 100],
+    )
+    st.plotly_chart(fig_radar, use_container_width=True)
+
+    # --- Aligned percentile bars ---
+    st.header("📊 Percentile Ranks by Metric")
+    fig_bar = px.bar(
+        long_df,
+        x="Metric",
+        y="Percentile",
+        color="Player",
+        barmode="group",
+        range_y=[0, 100],
+    )
+    fig_bar.update_layout(xaxis_tickangle=-45)
+    st.plotly_chart(fig_bar, use_container_width=True)
+    st.dataframe(
+        percentiles.set_index("Player")[metrics].T.style.format("{:.1f}", na_rep="n/a"),
+        use_container_width=True,
+    )
+    st.caption(
+        "Percentiles are ranked against every player in the data set (100 = best). "
+        "Metrics a player has no value for, such as bowling for a pure batter, are n/a."
+    )
+
+    # --- Raw stats side by side ---
+    st.header("📋 Stats Side by Side")
+    for table, columns in COMPARE_COLUMNS.items():
+        rows = load_indexed(table).reindex(player_ids)[columns]
+        rows.index = pd.Index(percentiles["Player"], name="Player")
+        with st.expander(f"{table.title()} Stats", expanded=table == "batting"):
+            st.dataframe(rows.dropna(how="all"), use_container_width=True)
@@ -1,13 +1,12 @@
 # modules/player_fielding.py
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 
 def show_player_fielding(df):
     st.subheader("🧤 Fielding Leaderboards")
 
-    # Combine Catches + Caught Behind
-    df['Catches'] = df['Catches'] + df['Caught Behind']
+    # Combine Catches + Caught Behind (assign returns a new frame, the shared data is untouched)
+    df = df.assign(Catches=df['Catches'] + df['Caught Behind'])
 
     # --- Top Catchers ---
     st.header("🏆 Top Catchers")
@@ -0,0 +1,133 @@
+# modules/similarity.py
+import numpy as np
+import pandas as pd
+
+# Rate-style batting features, so players are compared on how they play rather than how much.
+# Bowling, fielding and MVP rates are derived in build_profile_matrix.
+BATTING_FEATURES = ["Average", "Strike Rate", "Boundary %", "Non-Boundary SR", "Conversion Rate", "Dismissal Rate"]
+
+BATCH_SIZE = 1024   # Query rows scored per matrix product, bounds memory to BATCH_SIZE × n floats
+
+
+def _per(numerator, denominator):
+    return (numerator / denominator.where(denominator > 0)).fillna(0)
+
+
+def build_profile_matrix(batting, bowling, fielding, mvp):
+    """
+    Build standardized feature vectors for every player in the merged tables.
+
+    Each feature is z-scored over the players who have it (bowling features only
+    over bowlers, and so on); players without a value sit at the mean. Flags for
+    "bats", "bowls" and "keeps" separate specialists from all-rounders. Rows are
+    left unnormalized so euclidean distance still sees how far a profile is from
+    the average; most_similar normalizes for cosine.
+
+    Parameters:
+        batting, bowling, fielding, mvp: The final_*_data tables (with Player ID).
+
+    Returns:
+        A DataFrame of player ids and names (row order of the matrix) and a
+        float32 matrix with one row of z-scores and flags per player.
+    """
+    bat = batting.set_index("Player ID")[BATTING_FEATURES + ["Name", "Balls Faced"]]
+    bat = bat[bat["Balls Faced"] > 0].rename(columns={"Name": "Player Name", "Strike Rate": "Batting SR"})
+
+    bowl = bowling.set_index("Player ID")
+    bowl = pd.DataFrame({
+        "Player Name": bowl["Player Name"],
+        "Economy": bowl["Economy"],
+        "Bowling SR": bowl["Strike Rate"].where(bowl["Wickets"] > 0, bowl["Balls Bowled"]),
+        "Wickets/Innings": _per(bowl["Wickets"], bowl["Innings"]),
+        "Dot Ball %": _per(bowl["Dot Balls"], bowl["Balls Bowled"]) * 100,
+    })
+
+    field = fielding.set_index("Player ID")
+    field = pd.DataFrame({
+        "Player Name": field["Player Name"],
+        "Catches/Match": _per(field["Catches"] + field["Caught Behind"], field["Matches"]),
+        "Dismissals/Match": field["Dismissals/Match"],
+        "Keeper Share": _per(field["Caught Behind"] + field["Stumpings"], field["Total Dismissals"]),
+    })
+
+    points = mvp.set_index("Player ID")
+    points = pd.DataFrame({
+        "Player Name": points["Player Name"],
+        "Batting Points/Match": _per(points["Batting Points"], points["Matches"]),
+        "Bowling Points/Match": _per(points["Bowling Points"], points["Matches"]),
+        "Fielding Points/Match": _per(points["Fielding Points"], points["Matches"]),
+    })
+
+    # One row per player across all four tables
+    tables = [bat.drop(columns="Balls Faced"), bowl, field, points]
+    profiles = pd.concat([t.drop(columns="Player Name") for t in tables], axis=1)
+    names = pd.concat([t["Player Name"] for t in tables], axis=1).bfill(axis=1).iloc[:, 0]
+
+    features = profiles.astype(float)
+    z = (features - features.mean()) / features.std(ddof=0).replace(0, 1)
+    z = z.fillna(0).clip(-5, 5)
+    z["Bats"] = profiles.index.isin(bat.index).astype(float)
+    z["Bowls"] = profiles.index.isin(bowl.index).astype(float)
+    z["Keeps"] = (profiles["Keeper Share"].fillna(0) > 0.5).astype(float)
+
+    matrix = z.to_numpy(dtype=np.float32)
+
+    players = pd.DataFrame({"Player ID": profiles.index.to_numpy(), "Player Name": names.to_numpy()})
+    return players, matrix
+
+
+def most_similar(players, matrix, player_ids, k=5, metric="cosine"):
+    """
+    Find the k most similar players for each of the given players.
+
+    Queries are scored in batches with one matrix product each, and the top k
+    are picked with argpartition, so a lookup never sorts the whole population.
+
+    Parameters:
+        players, matrix: Output of build_profile_matrix.
+        player_ids: Ids of the players to find neighbours for.
+        k: Number of neighbours per player.
+        metric: "cosine" (higher is closer, compares the shape of profiles) or
+                "euclidean" (lower is closer, also compares their magnitude).
+
+    Returns:
+        A DataFrame with Player ID, Similar Player ID, Similar Player Name,
+        Rank and Score columns.
+    """
+    if metric not in ("cosine", "euclidean"):
+        raise ValueError(f"Unknown metric: {metric}")
+
+    positions = pd.Index(players["Player ID"]).get_indexer(list(player_ids))
+    if (positions < 0).any():
+        missing = [pid for pid, pos in zip(player_ids, positions) if pos < 0]
+        raise KeyError(f"Players without a profile: {missing}")
+
+    k = min(k, len(players) - 1)
+    if k <= 0:
+        return pd.DataFrame(columns=["Player ID", "Similar Player ID", "Similar Player Name", "Rank", "Score"])
+
+    sq_norms = np.einsum("ij,ij->i", matrix, matrix)
+    norms = np.maximum(np.sqrt(sq_norms), 1e-9)
+    results = []
+    for start in range(0, len(positions), BATCH_SIZE):
+        batch = positions[start:start + BATCH_SIZE]
+        dots = matrix[batch] @ matrix.T
+        if metric == "cosine":
+            cost = -dots / (norms[batch, None] * norms[None, :])
+        else:
+            cost = np.sqrt(np.maximum(sq_norms[batch, None] + sq_norms[None, :] - 2 * dots, 0))
+        cost[np.arange(len(batch)), batch] = np.inf   # A player is not their own neighbour
+
+        top = np.argpartition(cost, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(cost, top, axis=1), axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        scores = np.take_along_axis(cost, top, axis=1)
+
+        results.append(pd.DataFrame({
+            "Player ID": np.repeat(players["Player ID"].to_numpy()[batch], k),
+            "Similar Player ID": players["Player ID"].to_numpy()[top.ravel()],
+            "Similar Player Name": players["Player Name"].to_numpy()[top.ravel()],
+            "Rank": np.tile(np.arange(1, k + 1), len(batch)),
+            "Score": (-scores if metric == "cosine" else scores).ravel().round(4),
+        }))
+    return pd.concat(results, ignore_index=True)
@@ -0,0 +1,236 @@
+# modules/simulation.py
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from modules.data_loader import dataset_version, load_table
+
+CHUNK_ELEMENTS = 4_000_000   # Player-matches (seasons × matches × players) per batch of draws, ~32 MB per array
+SQUAD_SIZE = 40              # Most-used batters and bowlers simulated; a season is played by a squad, not a register
+RUNS_MILESTONE = 100     # Milestones are the next multiple of these above a player's current total
+WICKETS_MILESTONE = 10
+
+# One pool per server process, shared by every session, so concurrent viewers
+# queue for the same few workers instead of each starting cpu_count processes
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+PARALLEL_MIN_WORK = 10_000_000   # Simulated player-matches below which worker start-up costs more than it saves
+
+_pool = None
+_pool_lock = threading.Lock()
+# One lock per forecast: sessions asking for the same one wait for it, others go ahead
+_simulation_locks = {}
+_simulation_locks_lock = threading.Lock()
+
+
+def _shared_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=MAX_WORKERS)
+        return _pool
+
+
+def season_rates(batting, bowling):
+    """
+    Derive per-match rates for the squad from the merged tables.
+
+    Batting: how often a player bats (innings per team match), balls faced per
+    innings (from average, strike rate and not-out rate) and runs per ball
+    (strike rate). Bowling: how often a player bowls, balls per innings,
+    wickets per ball (bowling strike rate) and runs per ball (economy).
+    Only the SQUAD_SIZE batters with the most innings and bowlers with the
+    most balls bowled are kept.
+
+    Parameters:
+        batting, bowling: The final_batting_data and final_bowling_data tables.
+
+    Returns:
+        Two DataFrames indexed by Player ID: batting rates and bowling rates.
+    """
+    team_matches = max(batting["Matches"].max(), bowling["Matches"].max())
+
+    bat = batting.set_index("Player ID")
+    bat = bat[(bat["Innings"] > 0) & (bat["Innings"].rank(method="first", ascending=False) <= SQUAD_SIZE)]
+    runs_per_ball = bat["Strike Rate"] / 100
+    # Average × dismissal share = runs per innings; divided by runs per ball = balls per innings
+    dismissal_share = (bat["Innings"] - bat["Not Outs"]) / bat["Innings"]
+    balls_per_innings = (bat["Average"] * dismissal_share / runs_per_ball.where(runs_per_ball > 0))
+    # Never dismissed (average 0) or never scored: fall back to the raw counts
+    balls_per_innings = balls_per_innings.where(bat["Average"] > 0, bat["Balls Faced"] / bat["Innings"]).fillna(0)
+    batting_rates = pd.DataFrame({
+        "Name": bat["Name"],
+        "Runs": bat["Runs"],
+        "Bat Probability": (bat["Innings"] / team_matches).clip(upper=1),
+        "Balls/Innings": balls_per_innings,
+        "Runs/Ball": runs_per_ball,
+    })
+
+    bowl = bowling.set_index("Player ID")
+    bowl = bowl[(bowl["Balls Bowled"] > 0) & (bowl["Balls Bowled"].rank(method="first", ascending=False) <= SQUAD_SIZE)]
+    bowling_rates = pd.DataFrame({
+        "Name": bowl["Player Name"],
+        "Wickets": bowl["Wickets"],
+        "Bowl Probability": (bowl["Innings"] / team_matches).clip(upper=1),
+        "Balls/Innings": (bowl["Balls Bowled"] / bowl["Innings"]).round(),
+        "Wickets/Ball": (1 / bowl["Strike Rate"].where(bowl["Strike Rate"] > 0)).fillna(0),
+        "Runs/Ball": bowl["Economy"] / 6,
+    })
+    return batting_rates, bowling_rates
+
+
+def _simulate_chunk(batting, bowling, matches, simulations, seed):
+    """
+    Simulate `simulations` seasons of `matches` matches in one batch of draws.
+
+    Every array is (simulation, match, player), so a whole chunk is a handful
+    of NumPy calls regardless of how many matches it contains.
+
+    Returns:
+        Season runs per batter, season wickets per bowler and wins per season.
+    """
+    rng = np.random.default_rng(seed)
+    shape_bat = (simulations, matches, len(batting["Runs/Ball"]))
+    shape_bowl = (simulations, matches, len(bowling["Runs/Ball"]))
+
+    # --- Batting: balls faced are geometric around the player's balls per innings ---
+    bats = rng.random(shape_bat) < batting["Bat Probability"]
+    balls = rng.geometric(1 / (batting["Balls/Innings"] + 1), shape_bat) - 1
+    runs = rng.poisson(balls * batting["Runs/Ball"]) * bats
+
+    # --- Bowling: a fixed spell per innings, wickets and runs drawn per ball ---
+    bowls = rng.random(shape_bowl) < bowling["Bowl Probability"]
+    spell = np.broadcast_to(bowling["Balls/Innings"], shape_bowl)
+    wickets = rng.binomial(spell, bowling["Wickets/Ball"]) * bowls
+    conceded = rng.poisson(spell * bowling["Runs/Ball"]) * bowls
+
+    # --- Result: our batting against what our attack concedes; ties count half ---
+    scored = runs.sum(axis=2)
+    against = conceded.sum(axis=2)
+    wins = ((scored > against) + 0.5 * (scored == against)).sum(axis=1)
+
+    return runs.sum(axis=1).astype(np.int32), wickets.sum(axis=1).astype(np.int32), wins
+
+
+def simulate_season(batting, bowling, matches=10, simulations=20000, seed=0, workers=None):
+    """
+    Monte Carlo forecast of the rest of a season.
+
+    Seasons are simulated in chunks of at most CHUNK_ELEMENTS player-matches,
+    so memory stays bounded however many seasons, matches or players are
+    asked for. Small jobs run in-process; jobs of at least PARALLEL_MIN_WORK
+    player-matches are spread over the module's shared pool of MAX_WORKERS
+    processes. Each chunk draws from its own stream spawned from one
+    SeedSequence, so results depend only on `seed` and the inputs, not on
+    where the chunks ran.
+
+    Parameters:
+        batting, bowling: The final_batting_data and final_bowling_data tables.
+        matches: Number of remaining matches to simulate.
+        simulations: Number of simulated seasons.
+        seed: Seed for the random streams.
+        workers: None to decide by job size, 1 to run in-process, or a number
+                 of processes for a private pool (e.g. for benchmarks).
+
+    Returns:
+        A dict with per-player simulated season totals ("runs", "wickets",
+        DataFrames with one row per simulation), simulated "wins" per season,
+        the "elapsed" seconds and simulated "matches_per_s".
+    """
+    global _pool
+    batting_rates, bowling_rates = season_rates(batting, bowling)
+    bat_arrays = {c: batting_rates[c].to_numpy(dtype=float) for c in ["Bat Probability", "Balls/Innings", "Runs/Ball"]}
+    bat_arrays["Runs"] = batting_rates["Runs"].to_numpy()
+    bowl_arrays = {c: bowling_rates[c].to_numpy(dtype=float)
+                   for c in ["Bowl Probability", "Balls/Innings", "Wickets/Ball", "Runs/Ball"]}
+    bowl_arrays["Balls/Innings"] = bowl_arrays["Balls/Innings"].astype(np.int64)
+
+    chunk = max(1, CHUNK_ELEMENTS // (matches * (len(batting_rates) + len(bowling_rates)) or 1))
+    sizes = [min(chunk, simulations - start) for start in range(0, simulations, chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(bat_arrays, bowl_arrays, matches, size, s) for size, s in zip(sizes, seeds)]
+
+    start = time.perf_counter()
+    work = simulations * matches * (len(batting_rates) + len(bowling_rates))
+    if workers is None:
+        workers = MAX_WORKERS if work >= PARALLEL_MIN_WORK else 1
+    if workers == 1 or len(args) == 1:
+        chunks = [_simulate_chunk(*a) for a in args]
+    elif workers == MAX_WORKERS:
+        try:
+            chunks = list(_shared_pool().map(_simulate_chunk, *zip(*args)))
+        except BrokenProcessPool:
+            _pool = None   # A dead worker breaks the pool for good; the next call starts a fresh one
+            raise
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(args))) as pool:
+            chunks = list(pool.map(_simulate_chunk, *zip(*args)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "runs": pd.DataFrame(np.concatenate([c[0] for c in chunks]), columns=batting_rates.index),
+        "wickets": pd.DataFrame(np.concatenate([c[1] for c in chunks]), columns=bowling_rates.index),
+        "wins": np.concatenate([c[2] for c in chunks]),
+        "batting_rates": batting_rates,
+        "bowling_rates": bowling_rates,
+        "elapsed": elapsed,
+        "matches_per_s": simulations * matches / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+def project_milestones(simulated, current, names, step):
+    """
+    Summarize simulated season totals per player.
+
+    Parameters:
+        simulated: DataFrame of simulated additions, one column per player.
+        current: Series of current totals indexed like the columns.
+        names: Series of player names indexed like the columns.
+        step: Milestones are the next multiple of `step` above the current total.
+
+    Returns:
+        A DataFrame with current total, projected percentiles, the next
+        milestone and the probability of reaching it.
+    """
+    totals = simulated.to_numpy() + current.to_numpy()
+    milestone = (current // step + 1) * step
+    p10, p50, p90 = np.percentile(totals, [10, 50, 90], axis=0)
+    projection = pd.DataFrame({
+        "Player": names.to_numpy(),
+        "Current": current.to_numpy(),
+        "Projected (mean)": totals.mean(axis=0).round(1),
+        "P10": p10, "Median": p50, "P90": p90,
+        "Next Milestone": milestone.to_numpy(),
+        "P(Milestone)": (totals >= milestone.to_numpy()).mean(axis=0).round(3),
+    }, index=simulated.columns)
+    return projection.sort_values("Projected (mean)", ascending=False)
+
+
+@lru_cache(maxsize=8)
+def _cached_season(matches, simulations, seed, version):
+    # version is part of the cache key so a rebuilt data set is simulated again
+    return simulate_season(load_table("batting"), load_table("bowling"), matches, simulations, seed)
+
+
+def load_season_simulation(matches=10, simulations=20000, seed=0):
+    """
+    Run (or reuse) a season simulation on the current data tables.
+
+    Sessions asking for the same forecast at once wait for the first and share
+    its result; cached forecasts and different forecasts never wait behind a
+    running simulation.
+    """
+    key = (matches, simulations, seed, dataset_version()[0])
+    with _simulation_locks_lock:
+        if len(_simulation_locks) > 64:
+            # Forget the locks of finished forecasts; their results stay in the lru cache
+            for idle in [k for k, lock in _simulation_locks.items() if not lock.locked()]:
+                del _simulation_locks[idle]
+        lock = _simulation_locks.setdefault(key, threading.Lock())
+    with lock:
+        return _cached_season(*key)
@@ -0,0 +1,240 @@
+# modules/snapshots.py
+import os
+from datetime import datetime, timezone
+from functools import lru_cache
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SNAPSHOT_DIR = os.path.join(BASE_DIR, "snapshots")
+
+CHECKPOINT_EVERY = 10   # Every Nth version is stored in full, so a lookup never replays more than N-1 deltas
+VERSION_COLUMNS = ["version", "recorded_at", "kind", "rows", "changed_cells", "deleted_rows", "file"]
+DELETED = "_deleted"    # Delta "column" marking a removed row
+
+
+def _table_dir(table):
+    return os.path.join(SNAPSHOT_DIR, table)
+
+
+def list_versions(table):
+    """
+    Return the recorded versions of a table, oldest first.
+
+    Returns:
+        A DataFrame with version, recorded_at (UTC), kind ("full" or "delta"),
+        row count, number of changed cells and deleted rows, and the parquet
+        file holding the version.
+    """
+    path = os.path.join(_table_dir(table), "versions.csv")
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=VERSION_COLUMNS)
+    versions = pd.read_csv(path)
+    versions["recorded_at"] = pd.to_datetime(versions["recorded_at"], utc=True, format="ISO8601")
+    return versions
+
+
+def _cell_changes(old, new):
+    """
+    List every cell that differs between two versions, one row per cell.
+
+    Numeric values go in a float "num" column and everything else in a "text"
+    column, so each stays in a typed, compressible column; both are null when
+    the new value is missing. Removed rows get one row with column DELETED.
+    """
+    rows = new.index.union(old.index)
+    a = old.reindex(rows)[new.columns]
+    b = new.reindex(rows)
+    differs = ~((a == b) | (a.isna() & b.isna()))
+    differs.loc[old.index.difference(new.index)] = False
+
+    cells = differs.stack()
+    cells = cells[cells].index.to_frame(index=False, name=["key", "column"])
+    values = b.stack(future_stack=True).reindex(pd.MultiIndex.from_frame(cells))
+    numeric = cells["column"].map(lambda c: pd.api.types.is_numeric_dtype(new[c])).to_numpy(dtype=bool)
+    cells["num"] = pd.to_numeric(values.where(numeric).to_numpy(), errors="coerce")
+    cells["text"] = pd.Series(values.to_numpy(), dtype="object").where(~numeric & values.notna().to_numpy())
+    cells["text"] = cells["text"].map(lambda v: v if v is None or pd.isna(v) else str(v)).astype("string")
+
+    deleted = pd.DataFrame({"key": old.index.difference(new.index), "column": DELETED})
+    return pd.concat([cells, deleted], ignore_index=True)
+
+
+def record_snapshot(table, df, key="Player ID", recorded_at=None, checkpoint_every=CHECKPOINT_EVERY):
+    """
+    Store a new version of a built table.
+
+    Every `checkpoint_every`-th version (and any version whose columns changed)
+    is a full parquet checkpoint. The versions in between are stored as cell
+    deltas against the previous version: one row per changed cell, appended to
+    a single columnar file per checkpoint, so a rebuild that touches a few
+    players costs a few rows rather than a copy of the table. A build that
+    changes nothing records no new version.
+
+    Parameters:
+        table: Table name, e.g. "batting".
+        df: The built table; `key` must be unique.
+        key: Column identifying a row across versions.
+        recorded_at: Timestamp of the build (defaults to now, UTC).
+        checkpoint_every: Interval of full checkpoints.
+
+    Returns:
+        The version number of the snapshot (the existing one if nothing changed).
+    """
+    if df[key].duplicated().any():
+        raise ValueError(f"Snapshot key {key!r} is not unique in {table}.")
+
+    directory = _table_dir(table)
+    os.makedirs(directory, exist_ok=True)
+    versions = list_versions(table)
+    new = df.set_index(key)
+
+    version = int(versions["version"].max()) + 1 if len(versions) else 1
+    kind = "full"
+    changes = pd.DataFrame()
+    if len(versions):
+        old = load_version(table, version - 1, key).set_index(key)
+        same_columns = list(old.columns) == list(new.columns)
+        changes = _cell_changes(old, new) if same_columns else changes
+        if same_columns and changes.empty:
+            return version - 1
+        checkpoint = int(versions.loc[versions["kind"] == "full", "version"].max())
+        if same_columns and version - checkpoint < checkpoint_every:
+            kind = "delta"
+
+    # Counted before the delta file's earlier versions are appended below
+    changed_cells = int((changes["column"] != DELETED).sum()) if kind == "delta" else new.size
+    deleted_rows = int((changes["column"] == DELETED).sum()) if kind == "delta" else 0
+
+    if kind == "full":
+        file_name = f"v{version:05d}.parquet"
+        new.reset_index().to_parquet(os.path.join(directory, file_name), index=False, compression="zstd")
+    else:
+        # All deltas since the last checkpoint share one file, rewritten (it is
+        # at most checkpoint_every - 1 versions long) instead of one file each
+        file_name = f"v{checkpoint:05d}_deltas.parquet"
+        path = os.path.join(directory, file_name)
+        changes.insert(0, "version", version)
+        if os.path.exists(path):
+            changes = pd.concat([pd.read_parquet(path), changes], ignore_index=True)
+        changes.to_parquet(path, index=False, compression="zstd")
+
+    recorded_at = pd.Timestamp(recorded_at or datetime.now(timezone.utc))
+    entry = pd.DataFrame([{
+        "version": version,
+        "recorded_at": (recorded_at.tz_localize("UTC") if recorded_at.tz is None else recorded_at).isoformat(),
+        "kind": kind,
+        "rows": len(new),
+        "changed_cells": changed_cells,
+        "deleted_rows": deleted_rows,
+        "file": file_name,
+    }])
+    path = os.path.join(directory, "versions.csv")
+    entry.to_csv(path, mode="a", header=not os.path.exists(path), index=False, encoding="utf-8")
+    return version
+
+
+def _apply_changes(df, changes):
+    """Apply one version's cell changes to the previous version (indexed by key)."""
+    deleted = changes["column"] == DELETED
+    df = df.drop(changes.loc[deleted, "key"])
+    cells = changes[~deleted]
+    added = pd.Index(cells["key"].unique()).difference(df.index)
+    if len(added):
+        df = df.reindex(df.index.append(added))
+    for column, group in cells.groupby("column", sort=False):
+        numeric = pd.api.types.is_numeric_dtype(df[column])
+        values = group["num"] if numeric else group["text"].astype(object).where(group["text"].notna(), None)
+        if numeric and pd.api.types.is_integer_dtype(df[column]) and values.notna().all():
+            values = values.astype(df[column].dtype)
+        df.loc[group["key"].to_numpy(), column] = values.to_numpy()
+    return df
+
+
+@lru_cache(maxsize=32)
+def _reconstruct(table, version, key):
+    # Versions never change once written, so (table, version) is a safe cache key
+    versions = list_versions(table).set_index("version")
+    if version not in versions.index:
+        raise KeyError(f"{table} has no version {version}")
+
+    checkpoint = versions.index[(versions.index <= version) & (versions["kind"] == "full")].max()
+    directory = _table_dir(table)
+    df = pd.read_parquet(os.path.join(directory, versions.loc[checkpoint, "file"]))
+    dtypes = df.dtypes
+    df = df.set_index(key)
+
+    if version > checkpoint:
+        deltas = pd.read_parquet(os.path.join(directory, f"v{checkpoint:05d}_deltas.parquet"))
+        deltas = deltas[deltas["version"] <= version]
+        for _, changes in deltas.groupby("version", sort=True):
+            df = _apply_changes(df, changes)
+
+    df = df.rename_axis(key).sort_index().reset_index()
+    # Rows added by a delta come in as missing-then-filled; restore the checkpoint's dtypes where they fit
+    for column, dtype in dtypes.items():
+        if df[column].dtype != dtype and (df[column].notna().all() or not pd.api.types.is_integer_dtype(dtype)):
+            df[column] = df[column].astype(dtype)
+    return df
+
+
+def load_version(table, version=None, key="Player ID"):
+    """
+    Reconstruct a past version of a table from its latest checkpoint and deltas.
+
+    Parameters:
+        table: Table name, e.g. "batting".
+        version: Version number (defaults to the latest).
+        key: Key column the snapshots were recorded with.
+
+    Returns:
+        The table as it was built at that version, sorted by key.
+    """
+    if version is None:
+        versions = list_versions(table)
+        if versions.empty:
+            raise KeyError(f"No snapshots recorded for {table}")
+        version = int(versions["version"].max())
+    return _reconstruct(table, int(version), key).copy()
+
+
+def version_at(table, when):
+    """Return the latest version recorded at or before `when` (naive times are UTC), or None."""
+    versions = list_versions(table)
+    when = pd.Timestamp(when)
+    when = when.tz_localize("UTC") if when.tz is None else when
+    earlier = versions[versions["recorded_at"] <= when]
+    return int(earlier["version"].max()) if len(earlier) else None
+
+
+def compare_versions(table, old, new, rank_by, ascending=False, name_column="Player Name", key="Player ID"):
+    """
+    Compute rank movements and stat changes between two versions of a table.
+
+    Parameters:
+        table: Table name, e.g. "batting".
+        old, new: Version numbers to compare.
+        rank_by: Column the leaderboard is ranked by.
+        ascending: Whether lower values rank higher (e.g. economy).
+        name_column: Column holding the player name.
+        key: Key column the snapshots were recorded with.
+
+    Returns:
+        A DataFrame with one row per player in either version: name, old and new
+        rank, Movement (positive = climbed), and a "Δ <column>" change for every
+        numeric column. Players new to the table have no old rank.
+    """
+    before = load_version(table, old, key).set_index(key)
+    after = load_version(table, new, key).set_index(key)
+    numeric = [c for c in after.select_dtypes("number").columns if c in before.columns]
+
+    moves = pd.DataFrame({
+        "Player": after[name_column].combine_first(before[name_column]),
+        "Old Rank": before[rank_by].rank(ascending=ascending, method="min"),
+        "New Rank": after[rank_by].rank(ascending=ascending, method="min"),
+    })
+    moves["Movement"] = moves["Old Rank"] - moves["New Rank"]
+    deltas = after[numeric].sub(before[numeric].reindex(after.index).fillna(0), fill_value=0)
+    moves = moves.join(deltas.add_prefix("Δ "))
+    moves.index.name = key
+    return moves.sort_values(["Movement", "New Rank"], ascending=[False, True]).reset_index()
@@ -0,0 +1,291 @@
+# modules/sources.py
+import hashlib
+import io
+import os
+import re
+import tarfile
+import zipfile
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, "Data")
+
+# Compressed tournament exports are read in place, member by member
+ARCHIVE_DIR = os.path.join(DATA_DIR, "archives")
+ARCHIVE_MANIFEST = "manifest.csv"   # Kept next to the archives
+ARCHIVE_CACHE = "parsed"            # Parsed leaderboards, one parquet file per archive member
+ARCHIVE_SUFFIXES = (".zip", ".tar.gz", ".tgz")
+MANIFEST_COLUMNS = ["archive", "size", "mtime_ns", "sha256", "member", "tournament_id", "kind", "tournament"]
+MEMBER_PATTERN = re.compile(r"(\d+)_(batting|bowling|fielding|mvp)_leaderboard\.csv$")
+MEMBER_SEPARATOR = "::"
+KINDS = ["batting", "bowling", "fielding", "mvp"]
+
+# Raw leaderboard exports per tournament, relative to Data/
+TOURNAMENTS = {
+    "Beer Cup": {
+        "batting": "Beer_Cup/1397502_batting_leaderboard.csv",
+        "bowling": "Beer_Cup/1397502_bowling_leaderboard.csv",
+        "fielding": "Beer_Cup/1397502_fielding_leaderboard.csv",
+        "mvp": "Beer_Cup/1397502_mvp_leaderboard.csv",
+    },
+    "Challengers Cup": {
+        "batting": "Challengers_Cup/1423920_batting_leaderboard.csv",
+        "bowling": "Challengers_Cup/1423920_bowling_leaderboard.csv",
+        "fielding": "Challengers_Cup/1423920_fielding_leaderboard.csv",
+        "mvp": "Challengers_Cup/1423920_mvp_leaderboard.csv",
+    },
+    "Liga": {
+        "batting": "Liga/batting_liga.csv",
+        "bowling": "Liga/bowling_liga.csv",
+        "fielding": "Liga/fielding_liga.csv",
+    },
+    "RS Cup": {
+        "batting": "RS_Cup/batting_rs_cup.csv",
+        "bowling": "RS_Cup/bowling_rs_cup.csv",
+        "fielding": "RS_Cup/fielding_rs_cup.csv",
+    },
+    "T20": {
+        "batting": "T20/1563884_batting_leaderboard.csv",
+        "bowling": "T20/1563884_bowling_leaderboard.csv",
+        "fielding": "T20/1563884_fielding_leaderboard.csv",
+        "mvp": "T20/1563884_mvp_leaderboard.csv",
+    },
+    "The Hundred": {
+        "batting": "The_Hunderd/batting_theHundred.csv",
+        "bowling": "The_Hunderd/bowling_theHundred.csv",
+        "fielding": "The_Hunderd/fielding_theHundred.csv",
+        "mvp": "The_Hunderd/mvp_theHundred.csv",
+    },
+    "Trebur Cup": {
+        "batting": "Trebur_Cup/1397148_batting_leaderboard.csv",
+        "bowling": "Trebur_Cup/1397148_bowling_leaderboard.csv",
+        "fielding": "Trebur_Cup/1397148_fielding_leaderboard.csv",
+        "mvp": "Trebur_Cup/1397148_mvp_leaderboard.csv",
+    },
+}
+
+
+def _sha256(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _ForwardReader(io.RawIOBase):
+    """Expose a forward-only tar member stream through the standard io interface pandas expects."""
+
+    def __init__(self, f):
+        self._f = f
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self._f.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def _iter_members(path):
+    """
+    Stream the regular files of a zip or tar(.gz) archive without extracting them.
+
+    Yields:
+        (member name, readable binary file object) pairs; each file object is
+        only valid until the next member is requested.
+    """
+    if path.endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir():
+                    with archive.open(info) as f:
+                        yield info.filename, f
+    else:
+        # "r|*" reads the archive as a forward-only stream: no seeking, no temp files
+        with tarfile.open(path, mode="r|*") as archive:
+            for member in archive:
+                if member.isfile():
+                    yield member.name, io.BufferedReader(_ForwardReader(archive.extractfile(member)))
+
+
+def _tournament_name(member, tournament_id, known_ids):
+    """Name a tournament found in an archive: reuse a configured name, else its folder, else its id."""
+    if tournament_id in known_ids:
+        return known_ids[tournament_id]
+    folder = os.path.basename(os.path.dirname(member))
+    return folder.replace("_", " ").strip() or f"Tournament {tournament_id}"
+
+
+def _cache_path(archive_dir, sha, member):
+    """Where scan_archives keeps the parsed frame of one member, keyed by its archive's content hash."""
+    tournament_id, kind = MEMBER_PATTERN.search(member).groups()
+    return os.path.join(archive_dir, ARCHIVE_CACHE, f"{sha[:16]}_{tournament_id}_{kind}.parquet")
+
+
+def load_archive_manifest(archive_dir=ARCHIVE_DIR):
+    """Return the recorded archive members (see scan_archives)."""
+    path = os.path.join(archive_dir, ARCHIVE_MANIFEST)
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=MANIFEST_COLUMNS)
+    return pd.read_csv(path, dtype={"tournament_id": str, "sha256": str})
+
+
+def scan_archives(archive_dir=ARCHIVE_DIR):
+    """
+    Discover and parse the leaderboards inside every archive in archive_dir.
+
+    This is the only step that writes the manifest: run it (get_archive_manifest.py)
+    whenever exports are added to or replaced in archive_dir. Members matching
+    <id>_<kind>_leaderboard.csv are recorded together with the archive's size,
+    mtime and SHA-256, and parsed once into a parquet cache that
+    read_leaderboard reuses. An archive whose size and mtime match the manifest
+    is skipped without being read at all; one whose content hash is unchanged
+    (e.g. re-downloaded) is skipped after hashing. Only new or changed archives
+    are parsed, and cached frames of archives that are gone are removed.
+
+    The archives themselves are never extracted. The cache holds parsed frames
+    (compressed, columnar) rather than CSVs: it costs one extra write per
+    changed archive, so that each builder (a separate process) loads a frame
+    instead of decompressing and parsing every archive on every build.
+
+    Parameters:
+        archive_dir: Directory holding .zip / .tar.gz / .tgz exports.
+
+    Returns:
+        The updated manifest and the list of archives (relative to Data/) that
+        were new or changed, i.e. parsed in this run.
+    """
+    manifest = load_archive_manifest(archive_dir)
+    known_ids = {}
+    for name, paths in TOURNAMENTS.items():
+        for path in paths.values():
+            match = MEMBER_PATTERN.search(path)
+            if match:
+                known_ids[match.group(1)] = name
+
+    names = sorted(f for f in os.listdir(archive_dir) if f.endswith(ARCHIVE_SUFFIXES)) \
+        if os.path.isdir(archive_dir) else []
+    rows, changed, dirty = [], [], False
+    for file_name in names:
+        path = os.path.join(archive_dir, file_name)
+        archive = os.path.relpath(path, DATA_DIR)
+        stat = os.stat(path)
+        previous = manifest[manifest["archive"] == archive]
+
+        if len(previous) and previous["size"].iloc[0] == stat.st_size \
+                and previous["mtime_ns"].iloc[0] == stat.st_mtime_ns:
+            rows.append(previous)
+            continue
+        sha = _sha256(path)
+        dirty = True
+        if len(previous) and previous["sha256"].iloc[0] == sha:
+            rows.append(previous.assign(size=stat.st_size, mtime_ns=stat.st_mtime_ns))
+            continue
+
+        members = []
+        os.makedirs(os.path.join(archive_dir, ARCHIVE_CACHE), exist_ok=True)
+        for member, f in _iter_members(path):
+            match = MEMBER_PATTERN.search(member)
+            if match:
+                tournament_id, kind = match.groups()
+                pd.read_csv(f).to_parquet(_cache_path(archive_dir, sha, member), index=False)
+                members.append([archive, stat.st_size, stat.st_mtime_ns, sha, member, tournament_id, kind,
+                                _tournament_name(member, tournament_id, known_ids)])
+        rows.append(pd.DataFrame(members, columns=MANIFEST_COLUMNS))
+        changed.append(archive)
+
+    manifest = pd.concat(rows, ignore_index=True) if rows else pd.DataFrame(columns=MANIFEST_COLUMNS)
+    # Archives that disappeared also change the manifest
+    dirty |= set(manifest["archive"]) != set(load_archive_manifest(archive_dir)["archive"])
+    if dirty:
+        manifest.to_csv(os.path.join(archive_dir, ARCHIVE_MANIFEST), index=False, encoding="utf-8")
+
+    cache_dir = os.path.join(archive_dir, ARCHIVE_CACHE)
+    keep = {_cache_path(archive_dir, row.sha256, row.member) for row in manifest.itertuples(index=False)}
+    for file_name in os.listdir(cache_dir) if os.path.isdir(cache_dir) else []:
+        if os.path.join(cache_dir, file_name) not in keep:
+            os.remove(os.path.join(cache_dir, file_name))
+    return manifest, changed
+
+
+def all_tournaments(archive_dir=ARCHIVE_DIR):
+    """
+    Return every tournament's leaderboard sources: the loose files in
+    TOURNAMENTS plus the archive members recorded by the last scan_archives().
+
+    An archive member is addressed as "<archive>::<member>". When an archive
+    holds a tournament that is also configured as loose files, the archive's
+    (newer) export of each kind takes precedence. Nothing is scanned or written.
+
+    Returns:
+        A dict mapping tournament name to {kind: source path relative to Data/}.
+    """
+    manifest = load_archive_manifest(archive_dir)
+    tournaments = {name: dict(paths) for name, paths in TOURNAMENTS.items()}
+    for row in manifest.itertuples(index=False):
+        tournaments.setdefault(row.tournament, {})[row.kind] = f"{row.archive}{MEMBER_SEPARATOR}{row.member}"
+    return tournaments
+
+
+@lru_cache(maxsize=8)
+def _archive_frames(path, size, mtime_ns):
+    # One streaming pass parses every leaderboard in the archive; size and
+    # mtime are part of the cache key so a replaced archive is read again
+    return {
+        member: pd.read_csv(f)
+        for member, f in _iter_members(path)
+        if MEMBER_PATTERN.search(member)
+    }
+
+
+def _read_member(archive_path, member):
+    """
+    Return one parsed archive member: the frame cached by scan_archives while the
+    archive still matches the manifest, else parsed from the archive itself, or
+    None if the archive or the member is gone since the last scan.
+    """
+    if not os.path.exists(archive_path):
+        return None
+    archive_dir = os.path.dirname(archive_path)
+    stat = os.stat(archive_path)
+    manifest = load_archive_manifest(archive_dir)
+    row = manifest[(manifest["archive"] == os.path.relpath(archive_path, DATA_DIR)) & (manifest["member"] == member)]
+    if len(row) and row["size"].iloc[0] == stat.st_size and row["mtime_ns"].iloc[0] == stat.st_mtime_ns:
+        cached = _cache_path(archive_dir, row["sha256"].iloc[0], member)
+        if os.path.exists(cached):
+            # Parquet brings missing text back as None; read_csv gives NaN
+            return pd.read_parquet(cached).fillna(np.nan)
+    df = _archive_frames(archive_path, stat.st_size, stat.st_mtime_ns).get(member)
+    return None if df is None else df.copy()
+
+
+def read_leaderboard(tournament, kind, tournaments=None):
+    """
+    Read one raw leaderboard export, from a loose CSV or an archive member
+    (parsed once by scan_archives).
+
+    Parameters:
+        tournament: Key of TOURNAMENTS (or of all_tournaments()).
+        kind: "batting", "bowling", "fielding" or "mvp".
+        tournaments: Sources to look the tournament up in (defaults to all_tournaments()).
+
+    Returns:
+        A DataFrame, or None if the tournament has no export of that kind. An
+        archive member that is gone since the last scan_archives() (archive
+        replaced or deleted) counts as no export, unless TOURNAMENTS configures
+        a loose file for it.
+    """
+    path = (tournaments or all_tournaments()).get(tournament, {}).get(kind)
+    df = None
+    if path is not None and MEMBER_SEPARATOR in path:
+        archive, member = path.split(MEMBER_SEPARATOR, 1)
+        df = _read_member(os.path.join(DATA_DIR, archive), member)
+        path = TOURNAMENTS.get(tournament, {}).get(kind) if df is None else None
+    if path is not None:
+        df = pd.read_csv(os.path.join(DATA_DIR, path))
+    return None if df is None else df.drop(columns=["team_id"], errors="ignore")
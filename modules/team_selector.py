@@ -0,0 +1,165 @@
+# modules/team_selector.py
+import numpy as np
+import pandas as pd
+
+TEAM_SIZE = 11
+MIN_BALLS_PER_MATCH = 12   # Two overs a match makes a player a bowling option
+KEEPER_SHARE = 0.5         # Keepers take most of their dismissals behind the stumps
+# MVP "Player Role" patterns (case-insensitive): "Wicket-keeper" and "Wicket-keeper batter"
+# keep; "Bowler" and "All-Rounder" bowl. Batters ("Top-order batter", ...) match neither.
+KEEPER_ROLES = r"wicket-?keeper"
+BOWLER_ROLES = r"bowler|all-?rounder"
+
+
+def build_squad(batting, bowling, fielding, mvp):
+    """
+    Combine the final tables into one row per player with what selection needs.
+
+    Roles are read from the data as well as the (often empty) MVP "Player Role":
+    a bowler averages at least MIN_BALLS_PER_MATCH balls a match or has a
+    bowling role, a keeper takes most of their dismissals as caught-behind or
+    stumpings or has a wicket-keeper role.
+
+    Parameters:
+        batting, bowling, fielding, mvp: The final_*_data tables (with Player ID).
+
+    Returns:
+        A DataFrame indexed by Player ID with name, matches, MVP points, headline
+        stats and boolean Bowler / Keeper columns.
+    """
+    bat = batting.set_index("Player ID")
+    bowl = bowling.set_index("Player ID")
+    field = fielding.set_index("Player ID")
+    points = mvp.set_index("Player ID")
+
+    squad = pd.concat([
+        points[["Player Name", "Player Role", "Total Points", "Matches"]],
+        bat[["Name", "Matches", "Runs", "Strike Rate"]].rename(columns={"Matches": "Batting Matches"}),
+        bowl[["Player Name", "Wickets", "Economy", "Balls Bowled", "Matches"]].rename(
+            columns={"Player Name": "Bowling Name", "Matches": "Bowling Matches"}),
+        field[["Caught Behind", "Stumpings", "Total Dismissals"]],
+    ], axis=1)
+
+    squad["Player Name"] = squad["Player Name"].fillna(squad["Name"]).fillna(squad["Bowling Name"])
+    squad["Matches"] = squad[["Matches", "Batting Matches", "Bowling Matches"]].max(axis=1)
+    squad = squad.drop(columns=["Name", "Bowling Name", "Batting Matches", "Bowling Matches"])
+    counts = ["Total Points", "Runs", "Wickets", "Balls Bowled", "Caught Behind", "Stumpings", "Total Dismissals"]
+    squad[counts] = squad[counts].fillna(0)
+
+    squad["Points/Match"] = (squad["Total Points"] / squad["Matches"].where(squad["Matches"] > 0)).fillna(0).round(2)
+    keeper_dismissals = squad["Caught Behind"] + squad["Stumpings"]
+    role = squad["Player Role"].astype("string")
+    squad["Bowler"] = (squad["Balls Bowled"] / squad["Matches"].where(squad["Matches"] > 0) >= MIN_BALLS_PER_MATCH) \
+        | role.str.contains(BOWLER_ROLES, case=False, na=False)
+    squad["Keeper"] = ((keeper_dismissals > 0) & (keeper_dismissals >= KEEPER_SHARE * squad["Total Dismissals"])) \
+        | role.str.contains(KEEPER_ROLES, case=False, na=False)
+    squad.index.name = "Player ID"
+    return squad
+
+
+def _prune_dominated(values, bowler, keeper, overseas, team_size):
+    """
+    Drop players who can never make the XI: if team_size others are at least as
+    valuable and at least as useful for every constraint, one of them can always
+    replace the player without breaking a constraint or losing points.
+    """
+    dominates = (
+        (values[:, None] >= values[None, :])
+        & (bowler[:, None] >= bowler[None, :])
+        & (keeper[:, None] >= keeper[None, :])
+        & (overseas[:, None] <= overseas[None, :])
+    )
+    # Strictly better somewhere, or equal and earlier, so identical players don't prune each other
+    strict = (values[:, None] > values[None, :]) | (bowler[:, None] > bowler[None, :]) \
+        | (keeper[:, None] > keeper[None, :]) | (overseas[:, None] < overseas[None, :])
+    earlier = np.arange(len(values))[:, None] < np.arange(len(values))[None, :]
+    dominates &= strict | earlier
+    np.fill_diagonal(dominates, False)
+    return dominates.sum(axis=0) < team_size
+
+
+def best_xi(squad, value="Points/Match", team_size=TEAM_SIZE, min_bowlers=5, require_keeper=True,
+            overseas=(), max_overseas=4, unavailable=()):
+    """
+    Pick the team with the highest total value under selection constraints.
+
+    Exact dynamic programme over (players picked, bowlers picked, keeper picked,
+    overseas picked), one pass per player; bowler counts are capped at
+    min_bowlers, so the state space stays tiny. Players dominated by at least
+    team_size others are pruned before the search.
+
+    Parameters:
+        squad: Output of build_squad.
+        value: Column to maximize (e.g. "Points/Match" or "Total Points").
+        team_size: Players to select.
+        min_bowlers: Minimum number of bowlers in the XI.
+        require_keeper: Whether the XI needs a wicket-keeper.
+        overseas: Player IDs that count as overseas.
+        max_overseas: Maximum number of overseas players.
+        unavailable: Player IDs that cannot be selected.
+
+    Returns:
+        The selected rows of the squad, sorted by value.
+
+    Raises:
+        ValueError: If no team satisfies the constraints.
+    """
+    pool = squad[~squad.index.isin(list(unavailable))]
+    values = pool[value].to_numpy(dtype=float)
+    bowler = pool["Bowler"].to_numpy(dtype=bool)
+    keeper = pool["Keeper"].to_numpy(dtype=bool)
+    is_overseas = pool.index.isin(list(overseas))
+
+    keep = _prune_dominated(values, bowler, keeper, is_overseas, team_size)
+    pool, values, bowler, keeper, is_overseas = pool[keep], values[keep], bowler[keep], keeper[keep], is_overseas[keep]
+
+    # best[k, b, w, o]: highest value with k players, min(b, min_bowlers) bowlers, w keepers (0/1), o overseas
+    max_overseas = min(max_overseas, team_size)
+    shape = (team_size + 1, min_bowlers + 1, 2, max_overseas + 1)
+    best = np.full(shape, -np.inf)
+    best[0, 0, 0, 0] = 0.0
+    history = [best]
+
+    for v, is_b, is_k, is_o in zip(values, bowler, keeper, is_overseas):
+        cand = np.full(shape, -np.inf)
+        cand[1:] = best[:-1]
+        if is_b and min_bowlers > 0:
+            shifted = np.full(shape, -np.inf)
+            shifted[:, 1:] = cand[:, :-1]
+            shifted[:, -1] = np.maximum(shifted[:, -1], cand[:, -1])   # Bowlers beyond the minimum stay capped
+            cand = shifted
+        if is_k:
+            cand[:, :, 1] = np.maximum(cand[:, :, 0], cand[:, :, 1])
+            cand[:, :, 0] = -np.inf
+        if is_o:
+            cand[..., 1:] = cand[..., :-1].copy()
+            cand[..., 0] = -np.inf
+        best = np.maximum(best, cand + v)
+        history.append(best)
+
+    final = best[team_size, min_bowlers, 1 if require_keeper else slice(None)]
+    if not np.isfinite(final).any():
+        raise ValueError("No team satisfies the selection constraints.")
+    flat = np.unravel_index(np.argmax(final), final.shape)
+    state = (team_size, min_bowlers) + ((1,) if require_keeper else (flat[0],)) + (flat[-1],)
+
+    # --- Walk the table backwards to recover the picks ---
+    picked = []
+    for i in range(len(values) - 1, -1, -1):
+        before = history[i]
+        target = history[i + 1][state]
+        if np.isclose(before[state], target):
+            continue
+        k, b, w, o = state
+        prev_o = o - int(is_overseas[i])
+        prev_b = [b - 1, b] if bowler[i] and min_bowlers > 0 and b == min_bowlers else [b - int(bowler[i] and min_bowlers > 0)]
+        prev_w = [0, 1] if keeper[i] and w == 1 else [w]
+        for pb in prev_b:
+            found = next((pw for pw in prev_w if pb >= 0 and prev_o >= 0
+                          and np.isclose(before[k - 1, pb, pw, prev_o] + values[i], target)), None)
+            if found is not None:
+                state = (k - 1, pb, found, prev_o)
+                break
+        picked.append(i)
+
+    return pool.iloc[picked].sort_values(value, ascending=False)
@@ -1,16 +1,12 @@
 # pages/Batting.py
 import streamlit as st
-import pandas as pd
-import os
 
+from modules.data_loader import load_table
 from modules.player_stats import show_player_stats
 
-# Load data
-#@st.cache_data
+# Load data (cached per process by the data layer)
 def load_data():
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    csv_path = os.path.join(base_dir, "../final_batting_data.csv")
-    return pd.read_csv(csv_path)
+    return load_table("batting")
 
 df = load_data()
 
@@ -1,13 +1,12 @@
 import streamlit as st
-import pandas as pd
 import plotly.express as px
-import os
 
-#@st.cache_data
+from modules.cube import cube_slice
+from modules.data_loader import load_cube, load_table
+
+# Cached per process by the data layer
 def load_data():
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    csv_path = os.path.join(base_dir, "../final_bowling_data.csv")
-    return pd.read_csv(csv_path)
+    return load_table("bowling")
 
 df = load_data()
 
@@ -89,8 +88,10 @@ with st.expander("See Data Table"):
 
 st.subheader("🌀 Bowling Style Distribution")
 
-style_counts = df["Bowling Style"].value_counts().reset_index()
-style_counts.columns = ["Bowling Style", "Count"]
+# Bowlers per style come precomputed in the rollup cube
+style_counts = cube_slice(load_cube(), by=["bowling_style"], team="SPVGG Dragons")
+style_counts = style_counts[style_counts["bowlers"] > 0].sort_values("bowlers", ascending=False)
+style_counts = style_counts[["bowling_style", "bowlers"]].rename(columns={"bowling_style": "Bowling Style", "bowlers": "Count"})
 
 fig = px.pie(
     style_counts,
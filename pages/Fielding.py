@@ -1,14 +1,11 @@
 # pages/Fielding.py
 import streamlit as st
-import pandas as pd
-import os
+from modules.data_loader import load_table
 from modules.player_fielding import show_player_fielding
 
-#@st.cache_data
+# Cached per process by the data layer
 def load_data():
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    csv_path = os.path.join(base_dir, "../final_fielding_data.csv")
-    df = pd.read_csv(csv_path)
+    df = load_table("fielding")
     # Remove players with zero dismissals
     df = df[df["Total Dismissals"] > 0]
     return df
@@ -0,0 +1,73 @@
+# pages/Movers.py
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from modules.snapshots import compare_versions, list_versions, version_at
+
+# Leaderboard: (snapshot table, rank by, name column, lower is better)
+LEADERBOARDS = {
+    "Batting": ("batting", "Runs", "Name", False),
+    "Bowling": ("bowling", "Wickets", "Player Name", False),
+    "Fielding": ("fielding", "Total Dismissals", "Player Name", False),
+    "MVP": ("mvp", "Total Points", "Player Name", False),
+}
+
+# --- Page Title ---
+st.title("📈 Leaderboard Movers")
+
+board = st.radio("Leaderboard", list(LEADERBOARDS), horizontal=True, key="movers_board")
+table, rank_by, name_column, ascending = LEADERBOARDS[board]
+
+versions = list_versions(table)
+if len(versions) < 2:
+    st.info("Movers appear once the leaderboard has been rebuilt at least twice.")
+    st.stop()
+
+# --- Versions to compare: latest vs the last build at least a week older ---
+labels = {
+    int(v): f"v{int(v)} — {ts:%Y-%m-%d %H:%M}" for v, ts in zip(versions["version"], versions["recorded_at"])
+}
+latest = int(versions["version"].max())
+week_ago = version_at(table, versions["recorded_at"].max() - pd.Timedelta(days=7))
+baseline = week_ago if week_ago is not None and week_ago != latest else int(versions["version"].min())
+
+col1, col2 = st.columns(2)
+options = list(labels)
+old = col1.selectbox("From", options, index=options.index(baseline), format_func=labels.get, key="movers_from")
+new = col2.selectbox("To", options, index=options.index(latest), format_func=labels.get, key="movers_to")
+if old >= new:
+    st.warning("Pick a 'From' version older than the 'To' version.")
+    st.stop()
+
+moves = compare_versions(table, old, new, rank_by, ascending=ascending, name_column=name_column)
+delta = f"Δ {rank_by}"
+
+# --- Summary ---
+col1, col2, col3 = st.columns(3)
+col1.metric("Players Climbing", int((moves["Movement"] > 0).sum()))
+col2.metric("New Entries", int(moves["Old Rank"].isna().sum()))
+col3.metric(f"Total {delta}", round(moves[delta].sum(), 2) if delta in moves else 0)
+
+# --- Biggest movers ---
+st.header(f"🚀 Movers by {rank_by}")
+ranked = moves.dropna(subset=["Old Rank", "New Rank"])
+movers = pd.concat([ranked.head(5), ranked[ranked["Movement"] < 0].tail(5)]).drop_duplicates("Player ID")
+fig = px.bar(
+    movers,
+    x="Movement",
+    y="Player",
+    orientation="h",
+    color="Movement",
+    color_continuous_scale="RdYlGn",
+    color_continuous_midpoint=0,
+    labels={"Movement": "Places gained", "Player": ""},
+)
+fig.update_layout(yaxis={"categoryorder": "total ascending"})
+st.plotly_chart(fig, use_container_width=True)
+
+# --- Full table ---
+st.header("📋 Rank and Stat Changes")
+columns = ["Player", "Old Rank", "New Rank", "Movement"] + [c for c in moves.columns if c.startswith("Δ ")]
+changed = moves[(moves["Movement"].fillna(1) != 0) | (moves.filter(like="Δ ") != 0).any(axis=1)]
+st.dataframe(changed[columns], use_container_width=True, hide_index=True)
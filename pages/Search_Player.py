@@ -2,19 +2,16 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import os
 
-# --- Load Data ---
-#@st.cache_data
-def load_data():
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    batting_path = os.path.join(base_dir, "../final_batting_data.csv")
-    bowling_path = os.path.join(base_dir, "../final_bowling_data.csv")
-    fielding_path = os.path.join(base_dir, "../final_fielding_data.csv")
+from modules.data_loader import load_player_directory, load_profiles, load_table
+from modules.player_compare import show_player_comparison
+from modules.similarity import most_similar
 
-    batting_df = pd.read_csv(batting_path)
-    bowling_df = pd.read_csv(bowling_path)
-    fielding_df = pd.read_csv(fielding_path)
+# --- Load Data (cached per process by the data layer) ---
+def load_data():
+    batting_df = load_table("batting")
+    bowling_df = load_table("bowling")
+    fielding_df = load_table("fielding")
 
     # Optional: remove players with zero dismissals
     fielding_df = fielding_df[fielding_df["Total Dismissals"] > 0]
@@ -27,23 +24,29 @@ batting_df, bowling_df, fielding_df = load_data()
 st.title("🔍 Search Player")
 
 # --- Player Search ---
-all_players = sorted(
-    set(batting_df["Name"].dropna().unique()) |
-    set(bowling_df["Player Name"].dropna().unique()) |
-    set(fielding_df["Player Name"].dropna().unique())
+# Players are picked by id, so two players sharing a name stay apart
+directory = load_player_directory()
+mode = st.radio("Mode", ["Single Player", "Compare Players"], horizontal=True, key="mode")
+if mode == "Compare Players":
+    show_player_comparison(directory)
+    st.stop()
+
+selected_id = st.selectbox(
+    "Select a player", options=list(directory.index), format_func=directory["Label"].get, key="player"
 )
-selected_player = st.selectbox("Select a player", options=all_players)
 
-if selected_player:
+if selected_id is not None:
+    selected_player = directory.loc[selected_id, "Player Name"]
     view_type = st.radio(
         "Choose Stats Type",
         ["Batting Stats", "Bowling Stats", "Fielding Stats"],
-        horizontal=True
+        horizontal=True,
+        key="view_type",
     )
 
     # ------------------ Batting Stats ------------------
     if view_type == "Batting Stats":
-        player_data = batting_df[batting_df["Name"] == selected_player]
+        player_data = batting_df[batting_df["Player ID"] == selected_id]
         if not player_data.empty:
             st.subheader(f"🏏 Batting Stats for {selected_player}")
 
@@ -86,7 +89,7 @@ if selected_player:
 
     # ------------------ Bowling Stats ------------------
     elif view_type == "Bowling Stats":
-        player_data = bowling_df[bowling_df["Player Name"] == selected_player]
+        player_data = bowling_df[bowling_df["Player ID"] == selected_id]
         if not player_data.empty:
             st.subheader(f"🎯 Bowling Stats for {selected_player}")
 
@@ -126,7 +129,7 @@ if selected_player:
 
     # ------------------ Fielding Stats ------------------
     elif view_type == "Fielding Stats":
-        player_data = fielding_df[fielding_df["Player Name"] == selected_player]
+        player_data = fielding_df[fielding_df["Player ID"] == selected_id]
         if not player_data.empty:
             st.subheader(f"🧤 Fielding Stats for {selected_player}")
 
@@ -160,3 +163,27 @@ if selected_player:
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.warning(f"No fielding data found for {selected_player}")
+
+    # ------------------ Similar Players ------------------
+    st.subheader(f"🧭 Players Similar to {selected_player}")
+    players, profile_matrix = load_profiles()
+    if players["Player ID"].eq(selected_id).any():
+        col1, col2 = st.columns(2)
+        k = col1.slider("Number of similar players", min_value=1, max_value=10, value=5, key="similar_k")
+        metric = col2.radio("Distance", ["cosine", "euclidean"], horizontal=True, key="similar_metric")
+
+        similar = most_similar(players, profile_matrix, [selected_id], k=k, metric=metric)
+        fig = px.bar(
+            similar,
+            x="Similar Player Name",
+            y="Score",
+            color="Score",
+            text_auto=".2f",
+            color_continuous_scale="Purples" if metric == "cosine" else "Purples_r",
+            labels={"Similar Player Name": "Player", "Score": "Similarity" if metric == "cosine" else "Distance"},
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        with st.expander("See Data Table"):
+            st.dataframe(similar[["Rank", "Similar Player Name", "Score"]], hide_index=True)
+    else:
+        st.warning(f"No profile found for {selected_player}")
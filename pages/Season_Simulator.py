@@ -0,0 +1,76 @@
+# pages/Season_Simulator.py
+import streamlit as st
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+from modules.simulation import RUNS_MILESTONE, WICKETS_MILESTONE, load_season_simulation, project_milestones
+
+# --- Page Title ---
+st.title("🎲 Season Simulator")
+st.caption(
+    "Monte Carlo forecast of the remaining matches, drawn from every player's strike rate, "
+    "average, economy and bowling strike rate."
+)
+
+# --- Inputs ---
+col1, col2, col3 = st.columns(3)
+matches = col1.slider("Remaining matches", min_value=1, max_value=30, value=10, key="sim_matches")
+simulations = col2.select_slider(
+    "Simulated seasons", options=[5000, 10000, 20000, 50000, 100000], value=20000, key="sim_runs"
+)
+seed = col3.number_input("Seed", min_value=0, value=0, step=1, key="sim_seed")
+
+# Cached per (inputs, data version) by the simulation module
+result = load_season_simulation(matches, simulations, int(seed))
+batting_rates, bowling_rates = result["batting_rates"], result["bowling_rates"]
+
+# --- Throughput ---
+col1, col2, col3 = st.columns(3)
+col1.metric("Simulated Matches", f"{simulations * matches:,}")
+col2.metric("Run Time", f"{result['elapsed']:.2f} s")
+col3.metric("Throughput", f"{result['matches_per_s']:,.0f} matches/s")
+
+# --- Team Wins ---
+st.header("🏆 Projected Wins")
+wins = result["wins"]
+col1, col2, col3 = st.columns(3)
+col1.metric("Expected Wins", f"{wins.mean():.1f} / {matches}")
+col2.metric("P(Winning Record)", f"{(wins > matches / 2).mean():.0%}")
+col3.metric("80% Range", f"{np.percentile(wins, 10):g} – {np.percentile(wins, 90):g}")
+
+win_counts = pd.Series(wins).value_counts(normalize=True).sort_index()
+fig = px.bar(
+    x=win_counts.index,
+    y=win_counts.values,
+    labels={"x": "Wins", "y": "Probability"},
+    title=f"Distribution of Wins over {matches} Matches",
+)
+st.plotly_chart(fig, use_container_width=True)
+
+# --- Player Milestones ---
+st.header("🏏 Projected Runs")
+runs = project_milestones(result["runs"], batting_rates["Runs"], batting_rates["Name"], RUNS_MILESTONE)
+st.dataframe(runs.reset_index(drop=True), use_container_width=True, hide_index=True)
+
+st.header("🎯 Projected Wickets")
+wickets = project_milestones(result["wickets"], bowling_rates["Wickets"], bowling_rates["Name"], WICKETS_MILESTONE)
+st.dataframe(wickets.reset_index(drop=True), use_container_width=True, hide_index=True)
+
+# --- Distribution for one player ---
+st.header("📈 Season Total Distribution")
+stat = st.radio("Stat", ["Runs", "Wickets"], horizontal=True, key="sim_stat")
+table, rates = (runs, batting_rates) if stat == "Runs" else (wickets, bowling_rates)
+player = st.selectbox("Select a player", options=table["Player"].tolist(), key="sim_player")
+player_id = table.index[table["Player"] == player][0]
+
+totals = result[stat.lower()][player_id] + rates.loc[player_id, stat]
+fig = px.histogram(
+    x=totals,
+    nbins=40,
+    histnorm="probability",
+    labels={"x": f"Season {stat}", "y": "Probability"},
+    title=f"Projected Season {stat} for {player}",
+)
+fig.add_vline(x=table.loc[player_id, "Next Milestone"], line_dash="dash", annotation_text="Next milestone")
+st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,87 @@
+# pages/Team_Selector.py
+import time
+
+import streamlit as st
+import plotly.express as px
+
+from modules.data_loader import load_table
+from modules.team_selector import TEAM_SIZE, best_xi, build_squad
+
+# --- Load Data (cached per process by the data layer) ---
+def load_data():
+    return build_squad(load_table("batting"), load_table("bowling"), load_table("fielding"), load_table("mvp"))
+
+squad = load_data()
+names = squad["Player Name"].to_dict()
+
+# --- Page Title ---
+st.title("🧩 Team Selector")
+st.caption("Picks the XI with the most MVP points that satisfies the constraints below.")
+
+# --- Constraints ---
+col1, col2, col3 = st.columns(3)
+objective = col1.radio("Maximize", ["Points/Match", "Total Points"], horizontal=True, key="objective")
+min_bowlers = col2.slider("Minimum bowlers", min_value=0, max_value=8, value=5, key="min_bowlers")
+min_matches = col3.slider("Minimum matches played", min_value=0, max_value=20, value=5, key="min_matches")
+require_keeper = st.checkbox("Require a wicket-keeper", value=True, key="require_keeper")
+
+col1, col2 = st.columns([3, 1])
+overseas = col1.multiselect(
+    "Overseas players", options=list(names), format_func=names.get, key="overseas"
+)
+max_overseas = col2.number_input("Max overseas", min_value=0, max_value=TEAM_SIZE, value=4, key="max_overseas")
+unavailable = st.multiselect(
+    "Unavailable players", options=list(names), format_func=names.get, key="unavailable"
+)
+# Too few matches make points per match meaningless, so those players sit out
+unavailable = set(unavailable) | set(squad.index[squad["Matches"] < min_matches])
+
+start = time.perf_counter()
+try:
+    xi = best_xi(
+        squad,
+        value=objective,
+        min_bowlers=min_bowlers,
+        require_keeper=require_keeper,
+        overseas=overseas,
+        max_overseas=int(max_overseas),
+        unavailable=unavailable,
+    )
+except ValueError as e:
+    st.warning(f"{e} Relax a constraint or make more players available.")
+    st.stop()
+elapsed = time.perf_counter() - start
+
+# --- Summary ---
+col1, col2, col3, col4 = st.columns(4)
+col1.metric(objective, round(xi[objective].sum(), 2))
+col2.metric("Bowlers", int(xi["Bowler"].sum()))
+col3.metric("Overseas", int(xi.index.isin(overseas).sum()))
+col4.metric("Solved In", f"{elapsed * 1000:.1f} ms")
+
+# --- Selected XI ---
+st.header("✅ Selected XI")
+xi_table = xi.assign(Overseas=xi.index.isin(overseas))[
+    ["Player Name", objective, "Matches", "Runs", "Wickets", "Bowler", "Keeper", "Overseas"]
+].reset_index(drop=True)
+xi_table.index += 1
+st.dataframe(xi_table, use_container_width=True)
+
+fig = px.bar(
+    xi,
+    x="Player Name",
+    y=objective,
+    color=xi["Bowler"].map({True: "Bowler", False: "Batter"}).where(~xi["Keeper"], "Keeper"),
+    labels={"color": "Role", "Player Name": ""},
+    title="Contribution to the XI",
+)
+st.plotly_chart(fig, use_container_width=True)
+
+# --- Bench ---
+st.header("🪑 Best of the Rest")
+bench = squad[~squad.index.isin(xi.index) & ~squad.index.isin(unavailable)].sort_values(objective, ascending=False)
+st.dataframe(
+    bench[["Player Name", objective, "Matches", "Bowler", "Keeper"]].head(10).reset_index(drop=True),
+    use_container_width=True,
+    hide_index=True,
+)
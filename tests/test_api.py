@@ -0,0 +1,86 @@
+# tests/test_api.py
+import gzip
+import json
+
+import pytest
+
+from api import MAX_PER_PAGE, app
+from modules.data_loader import load_table
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+def test_leaderboard_pages_through_the_table(client):
+    batting = load_table("batting")
+    response = client.get("/api/leaderboards/batting?page=2&per_page=3")
+    body = response.get_json()
+
+    assert response.status_code == 200
+    assert body["total"] == len(batting)
+    assert (body["page"], body["per_page"]) == (2, 3)
+    assert [row["Player ID"] for row in body["items"]] == batting["Player ID"].iloc[3:6].tolist()
+
+
+def test_page_size_is_capped_and_pages_past_the_end_are_empty(client):
+    body = client.get(f"/api/leaderboards/bowling?per_page={MAX_PER_PAGE + 1000}").get_json()
+    assert body["per_page"] == MAX_PER_PAGE
+
+    body = client.get("/api/leaderboards/bowling?page=1000").get_json()
+    assert body["items"] == []
+
+
+@pytest.mark.parametrize("url, status", [
+    ("/api/leaderboards/unknown", 404),
+    ("/api/teams/Nobody%20XI", 404),
+    ("/api/players/999999999999", 404),
+    ("/api/leaderboards/batting?page=two", 400),
+    ("/api/nothing-here", 404),
+])
+def test_errors_are_json(client, url, status):
+    response = client.get(url)
+
+    assert response.status_code == status
+    assert response.mimetype == "application/json"
+    assert response.get_json()["error"]
+
+
+def test_player_profile_joins_every_table_on_the_id(client):
+    player_id = int(load_table("bowling")["Player ID"].iloc[0])
+    body = client.get(f"/api/players/{player_id}").get_json()
+
+    assert body["player_id"] == player_id
+    assert body["bowling"]["Player ID"] == player_id
+    assert body["percentiles"]["Player ID"] == player_id
+
+
+def test_unchanged_data_revalidates_with_304(client):
+    first = client.get("/api/teams")
+    assert first.status_code == 200
+    assert first.headers["Vary"] == "Accept-Encoding"
+
+    again = client.get("/api/teams", headers={"If-None-Match": first.headers["ETag"]})
+    assert again.status_code == 304
+    assert again.get_data() == b""
+
+    stale = client.get("/api/teams", headers={"If-None-Match": '"some-older-version"'})
+    assert stale.status_code == 200
+
+
+def test_gzip_is_served_when_accepted(client):
+    plain = client.get("/api/teams")
+    zipped = client.get("/api/teams", headers={"Accept-Encoding": "gzip"})
+
+    assert zipped.headers["Content-Encoding"] == "gzip"
+    assert zipped.headers["ETag"] != plain.headers["ETag"]
+    assert json.loads(gzip.decompress(zipped.get_data())) == plain.get_json()
+
+
+@pytest.mark.parametrize("accept", ["gzip;q=0", "identity", "deflate, gzip;q=0"])
+def test_gzip_is_not_served_when_refused(client, accept):
+    response = client.get("/api/teams", headers={"Accept-Encoding": accept})
+
+    assert "Content-Encoding" not in response.headers
+    assert response.get_json()["total"] > 0
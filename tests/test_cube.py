@@ -0,0 +1,51 @@
+# tests/test_cube.py
+import pytest
+
+from modules.cube import ALL, DIMENSIONS, build_cube, build_player_facts, cube_slice, cube_totals, index_cube
+from modules.data_loader import load_table
+from modules.identity import load_identity_map
+
+TEAM = "SPVGG Dragons"
+
+
+@pytest.fixture(scope="module")
+def cube():
+    return index_cube(build_cube(build_player_facts(load_identity_map())))
+
+
+@pytest.mark.parametrize("table, column, measure", [
+    ("batting", "Runs", "runs"),
+    ("batting", "Balls Faced", "balls_faced"),
+    ("bowling", "Wickets", "wickets"),
+    ("bowling", "Balls Bowled", "balls_bowled"),
+    ("fielding", "Total Dismissals", "dismissals"),
+    ("mvp", "Total Points", "mvp_points"),
+])
+def test_team_totals_match_the_final_tables(cube, table, column, measure):
+    final = load_table(table)
+    assert cube_totals(cube, team=TEAM)[measure] == pytest.approx(final[column].sum())
+
+
+def test_team_player_count_matches_the_final_tables(cube):
+    players = set()
+    for table in ["batting", "bowling", "fielding", "mvp"]:
+        players |= set(load_table(table)["Player ID"])
+    assert cube_totals(cube, team=TEAM)["players"] == len(players)
+
+
+def test_breakdowns_add_up_to_their_subtotal(cube):
+    by_tournament = cube_slice(cube, by=["tournament"], team=TEAM)
+    total = cube_totals(cube, team=TEAM)
+
+    assert len(by_tournament) > 1
+    assert (by_tournament["tournament"] != ALL).all()
+    for measure in ["runs", "wickets", "dismissals"]:
+        assert by_tournament[measure].sum() == total[measure]
+
+
+def test_missing_slices_are_empty_and_unknown_dimensions_raise(cube):
+    assert cube_slice(cube, team="Nobody XI").empty
+    assert cube_totals(cube, team="Nobody XI")["runs"] == 0
+    with pytest.raises(ValueError, match="Unknown cube dimensions"):
+        cube_slice(cube, by=["venue"])
+    assert set(cube.index.names) == {"grouping", *DIMENSIONS}
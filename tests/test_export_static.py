@@ -0,0 +1,143 @@
+# tests/test_export_static.py
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+import export_static
+from modules import data_loader
+from modules.cube import cube_slice, index_cube
+
+PLAYER_FILES = [f"-{view}.html" for view in export_static.PLAYER_VIEWS]
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """A copy of the built tables that the data layer and the exporter read instead of the real ones."""
+    directory = tmp_path / "data"
+    directory.mkdir()
+    for file_name in data_loader.DATA_FILES.values():
+        shutil.copy(os.path.join(data_loader.BASE_DIR, file_name), directory)
+    monkeypatch.setattr(data_loader, "BASE_DIR", str(directory))
+    monkeypatch.setattr(export_static, "SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+    # Profiles and the directory are cached by table mtimes, not paths
+    data_loader._profiles.cache_clear()
+    data_loader._player_directory.cache_clear()
+    yield directory
+    data_loader._profiles.cache_clear()
+    data_loader._player_directory.cache_clear()
+
+
+@pytest.fixture
+def export(data_dir, tmp_path, monkeypatch):
+    """
+    Run export_site in threads with stand-in renderers, recording which files
+    were rendered; the real pages are rendered in test_timing_metrics_*.
+    """
+    rendered = []
+    run_job = export_static.run_job
+
+    def recording_run_job(job, output_dir, old_sha):
+        rendered.append(job[1])
+        return run_job(job, output_dir, old_sha)
+
+    monkeypatch.setattr(export_static, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(export_static, "run_job", recording_run_job)
+    monkeypatch.setattr(export_static, "render_page", lambda script, title: export_static.render_document(title, ""))
+    monkeypatch.setattr(export_static, "render_team", lambda team: export_static.render_document(team, ""))
+    monkeypatch.setattr(export_static, "render_player",
+                        lambda pid, view, stem: export_static.render_document(f"{pid} {view}", ""))
+
+    def run():
+        rendered.clear()
+        stats = export_static.export_site(str(tmp_path / "site"), workers=1)
+        return stats, set(rendered)
+    return run
+
+
+def _edit(data_dir, name, edit):
+    path = os.path.join(data_dir, data_loader.DATA_FILES[name])
+    df = pd.read_csv(path)
+    edit(df)
+    df.to_csv(path, index=False)
+
+
+def test_unchanged_inputs_render_nothing(export):
+    stats, rendered = export()
+    assert stats["rendered"] == len(rendered) == stats["written"]
+    assert stats["skipped"] == 0
+
+    stats, rendered = export()
+    assert rendered == set()
+    assert stats["skipped"] > 0 and stats["written"] == 0
+
+
+def test_a_table_no_page_reads_renders_nothing(export, data_dir):
+    export()
+    with open(os.path.join(data_dir, data_loader.DATA_FILES["percentiles"]), "a") as f:
+        f.write("\n")
+
+    stats, rendered = export()
+    assert rendered == set()
+
+
+def test_one_fielding_row_renders_its_readers_and_that_player(export, data_dir):
+    export()
+    player_id = pd.read_csv(os.path.join(data_dir, data_loader.DATA_FILES["fielding"]))["Player ID"].iloc[0]
+
+    # Run outs feed no similarity feature, so no other player's neighbours change
+    def one_more_run_out(df):
+        df.loc[df["Player ID"] == player_id, "Run Outs"] += 1
+    _edit(data_dir, "fielding", one_more_run_out)
+
+    stats, rendered = export()
+    readers = {out for _, out, _, inputs in export_static.PAGES if "fielding" in inputs}
+    assert rendered == readers | {f"players/{player_id}{suffix}" for suffix in PLAYER_FILES}
+    assert stats["rendered"] == 6
+
+
+def test_team_view_follows_only_its_own_cube_rows():
+    table = data_loader.load_table("cube")
+    cube = index_cube(table)
+    teams = cube_slice(cube, by=["team"])["team"].tolist()
+    before = export_static.team_fingerprints("code", cube, teams)
+
+    edited = table.copy()
+    edited.loc[edited["team"] == teams[0], "runs"] += 1
+    after = export_static.team_fingerprints("code", index_cube(edited), teams)
+    assert [team for team in teams if before[team] != after[team]] == [teams[0]]
+
+    # Every job also depends on the rendering code
+    assert export_static.team_fingerprints("changed code", cube, teams[:1])[teams[0]] != before[teams[0]]
+
+
+def test_pages_of_a_removed_player_are_deleted(export, data_dir, tmp_path):
+    export()
+    site = tmp_path / "site"
+    player_id = pd.read_csv(os.path.join(data_dir, data_loader.DATA_FILES["fielding"]))["Player ID"].iloc[-1]
+    assert all((site / f"players/{player_id}{suffix}").exists() for suffix in PLAYER_FILES)
+
+    for name in export_static.PLAYER_TABLES:
+        _edit(data_dir, name, lambda df: df.drop(df.index[df["Player ID"] == player_id], inplace=True))
+
+    stats, _ = export()
+    assert stats["removed"] == 3
+    assert not any((site / f"players/{player_id}{suffix}").exists() for suffix in PLAYER_FILES)
+    with open(site / export_static.MANIFEST, encoding="utf-8") as f:
+        assert str(player_id) not in f.read()
+
+
+@pytest.mark.parametrize("script, metric", [
+    ("pages/Season_Simulator.py", "Throughput"),
+    ("pages/Team_Selector.py", "Solved In"),
+])
+def test_timing_metrics_stay_on_the_page_but_out_of_the_export(script, metric):
+    export_static.init_worker()
+    at = export_static._run_page(script)
+    assert metric in [m.label for m in at.metric]
+
+    first = export_static.render_page(script, "Page")
+    assert metric not in first
+    assert export_static.render_page(script, "Page") == first
@@ -0,0 +1,69 @@
+# tests/test_identity.py
+import pandas as pd
+import pytest
+
+from modules.identity import build_identity_map, normalize_names, resolve_player_ids
+
+TEAM = "SPVGG Dragons"
+
+
+def leaderboard(rows, with_ids=True):
+    columns = ["player_id", "name", "team_name"] if with_ids else ["Player Name", "Team Name"]
+    return pd.DataFrame([row if with_ids else row[1:] for row in rows], columns=columns)
+
+
+def test_normalize_names_folds_accents_case_and_punctuation():
+    names = pd.Series(["  Zoë  O'Brien ", "ROHIT.cric", "Ali_Khan 2"])
+    assert normalize_names(names).tolist() == ["zoe o brien", "rohit cric", "ali khan 2"]
+
+
+def test_near_duplicate_names_resolve_to_the_known_id():
+    batting = leaderboard([(101, "Rohit Cric", TEAM), (102, "Jonathan Smith", TEAM)])
+    mvp = leaderboard([(None, "RohitCric", TEAM), (None, "Jonathon Smith", TEAM)], with_ids=False)
+
+    identity = build_identity_map(batting, mvp)
+    resolved = resolve_player_ids(mvp, identity)
+
+    assert resolved["player_id"].tolist() == [101, 102]
+    # Canonical names come from the spelling seen with the id
+    assert resolved["Player Name"].tolist() == ["Rohit Cric", "Jonathan Smith"]
+
+
+def test_similar_names_in_other_teams_are_not_merged():
+    batting = leaderboard([(101, "Jonathan Smith", TEAM)])
+    mvp = leaderboard([(None, "Jonathon Smith", "Other XI")], with_ids=False)
+
+    identity = build_identity_map(batting, mvp)
+    player_id = resolve_player_ids(mvp, identity)["player_id"].iloc[0]
+
+    assert player_id < 0
+
+
+def test_new_players_get_synthetic_ids_and_near_duplicates_share_one():
+    mvp = leaderboard([
+        (None, "Arjun Mehta", TEAM), (None, "Arjun  Mehtaa", TEAM), (None, "Kofi Boateng", TEAM),
+    ], with_ids=False)
+
+    identity = build_identity_map(mvp)
+    ids = resolve_player_ids(mvp, identity)["player_id"].tolist()
+
+    assert all(i < 0 for i in ids)
+    assert ids[0] == ids[1] != ids[2]
+
+
+def test_extending_a_map_keeps_existing_ids():
+    first = build_identity_map(leaderboard([(None, "Kofi Boateng", TEAM)], with_ids=False))
+    extended = build_identity_map(
+        leaderboard([(None, "Kofi Boateng", TEAM), (None, "Lena Vogel", TEAM)], with_ids=False),
+        existing=first,
+    )
+
+    kofi = first.loc[first["name_variant"] == "Kofi Boateng", "player_id"].iloc[0]
+    assert extended.loc[extended["name_variant"] == "Kofi Boateng", "player_id"].tolist() == [kofi]
+    assert extended["player_id"].nunique() == 2
+
+
+def test_resolving_an_unmapped_player_raises():
+    identity = build_identity_map(leaderboard([(101, "Rohit Cric", TEAM)]))
+    with pytest.raises(ValueError, match="identity map"):
+        resolve_player_ids(leaderboard([(None, "Somebody Else", TEAM)], with_ids=False), identity)
@@ -0,0 +1,52 @@
+# tests/test_percentiles.py
+import pandas as pd
+import pytest
+
+from modules.percentiles import compute_percentiles
+
+
+@pytest.fixture
+def tables():
+    batting = pd.DataFrame({
+        "Player ID": [1, 2, 3], "Name": ["Batter", "All-Rounder", "Keeper"],
+        "Runs": [300, 200, 100], "Average": [30.0, 20.0, 10.0], "Strike Rate": [150.0, 120.0, 100.0],
+        "Boundary %": [60.0, 50.0, 40.0], "Conversion Rate": [0.2, 0.1, 0.0],
+    })
+    bowling = pd.DataFrame({
+        "Player ID": [2, 4], "Player Name": ["All-Rounder", "Bowler"],
+        "Wickets": [5, 0], "Economy": [7.5, 9.0], "Average": [20.0, 0.0], "Strike Rate": [18.0, 0.0],
+    })
+    fielding = pd.DataFrame({
+        "Player ID": [3], "Player Name": ["Keeper"], "Total Dismissals": [10], "Dismissals/Match": [1.0],
+    })
+    mvp = pd.DataFrame({"Player ID": [1, 2, 3, 4], "Player Name": ["Batter", "All-Rounder", "Keeper", "Bowler"],
+                        "Total Points": [40.0, 30.0, 20.0, 10.0]})
+    return {"batting": batting, "bowling": bowling, "fielding": fielding, "mvp": mvp}
+
+
+def test_best_value_ranks_highest_in_either_direction(tables):
+    percentiles = compute_percentiles(tables)
+
+    assert percentiles.loc[1, "Runs"] == 100
+    assert percentiles.loc[3, "Runs"] == pytest.approx(33.3)
+    # Lower economy is better
+    assert percentiles.loc[2, "Economy"] == 100
+    assert percentiles.loc[4, "Economy"] == 50
+
+
+def test_missing_metrics_stay_missing_instead_of_ranking_last(tables):
+    percentiles = compute_percentiles(tables)
+
+    assert percentiles.loc[1, ["Wickets", "Economy", "Dismissals"]].isna().all()
+    assert pd.isna(percentiles.loc[4, "Runs"])
+    # A bowling average of 0 means no wickets, not a perfect average
+    assert pd.isna(percentiles.loc[4, "Bowling Average"])
+    assert percentiles.loc[2, "Bowling Average"] == 100
+
+
+def test_every_player_is_listed_with_a_name(tables):
+    percentiles = compute_percentiles(tables)
+
+    assert sorted(percentiles.index) == [1, 2, 3, 4]
+    assert percentiles.loc[4, "Player Name"] == "Bowler"
+    assert percentiles.index.name == "Player ID"
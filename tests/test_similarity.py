@@ -0,0 +1,61 @@
+# tests/test_similarity.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.data_loader import load_table
+from modules.similarity import build_profile_matrix, most_similar
+
+
+@pytest.fixture
+def toy():
+    players = pd.DataFrame({"Player ID": [1, 2, 3, 4], "Player Name": ["A", "B", "C", "D"]})
+    matrix = np.array([
+        [1.0, 0.0],     # A
+        [4.0, 0.0],     # B: same direction as A, far away
+        [1.0, 0.5],     # C: close to A, different direction
+        [-1.0, 0.0],    # D: opposite
+    ], dtype=np.float32)
+    return players, matrix
+
+
+def test_cosine_compares_direction_and_euclidean_compares_distance(toy):
+    players, matrix = toy
+    cosine = most_similar(players, matrix, [1], k=1, metric="cosine")
+    euclidean = most_similar(players, matrix, [1], k=1, metric="euclidean")
+
+    assert cosine["Similar Player ID"].tolist() == [2]
+    assert cosine["Score"].iloc[0] == pytest.approx(1.0)
+    assert euclidean["Similar Player ID"].tolist() == [3]
+    assert euclidean["Score"].iloc[0] == pytest.approx(0.5)
+
+
+def test_neighbours_are_ranked_and_exclude_the_player(toy):
+    players, matrix = toy
+    similar = most_similar(players, matrix, [1, 4], k=10)
+
+    assert similar.groupby("Player ID").size().tolist() == [3, 3]
+    assert not (similar["Player ID"] == similar["Similar Player ID"]).any()
+    assert similar[similar["Player ID"] == 1]["Similar Player ID"].tolist() == [2, 3, 4]
+    assert similar["Rank"].tolist() == [1, 2, 3, 1, 2, 3]
+
+
+def test_unknown_players_and_metrics_raise(toy):
+    players, matrix = toy
+    with pytest.raises(KeyError):
+        most_similar(players, matrix, [99])
+    with pytest.raises(ValueError):
+        most_similar(players, matrix, [1], metric="manhattan")
+
+
+def test_profiles_cover_every_player_once():
+    tables = [load_table(name) for name in ["batting", "bowling", "fielding", "mvp"]]
+    players, matrix = build_profile_matrix(*tables)
+
+    # Batting rows only count once the player has faced a ball
+    batting, others = tables[0], tables[1:]
+    expected = set(batting.loc[batting["Balls Faced"] > 0, "Player ID"]).union(*(set(t["Player ID"]) for t in others))
+    assert set(players["Player ID"]) == expected
+    assert players["Player ID"].is_unique
+    assert matrix.shape[0] == len(players)
+    assert np.isfinite(matrix).all()
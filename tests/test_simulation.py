@@ -0,0 +1,133 @@
+# tests/test_simulation.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import modules.simulation as simulation
+from modules.data_loader import load_table
+from modules.simulation import project_milestones, season_rates, simulate_season
+
+
+@pytest.fixture(scope="module")
+def tables():
+    return load_table("batting"), load_table("bowling")
+
+
+def test_results_depend_only_on_the_seed(tables, monkeypatch):
+    monkeypatch.setattr(simulation, "CHUNK_ELEMENTS", 100_000)   # Several chunks, so the pool gets work
+    in_process = simulate_season(*tables, matches=3, simulations=5000, seed=7, workers=1)
+    pooled = simulate_season(*tables, matches=3, simulations=5000, seed=7, workers=2)
+    other_seed = simulate_season(*tables, matches=3, simulations=5000, seed=8, workers=1)
+
+    assert in_process["runs"].equals(pooled["runs"])
+    assert np.array_equal(in_process["wins"], pooled["wins"])
+    assert not in_process["runs"].equals(other_seed["runs"])
+
+
+def test_small_jobs_run_in_process(tables, monkeypatch):
+    def no_pool():
+        raise AssertionError("a small simulation started worker processes")
+
+    monkeypatch.setattr(simulation, "_shared_pool", no_pool)
+    monkeypatch.setattr(simulation, "MAX_WORKERS", 4)
+    result = simulate_season(*tables, matches=2, simulations=3000)
+    assert len(result["wins"]) == 3000
+
+
+def test_large_jobs_share_one_bounded_pool(tables, monkeypatch):
+    monkeypatch.setattr(simulation, "MAX_WORKERS", 2)
+    monkeypatch.setattr(simulation, "PARALLEL_MIN_WORK", 0)
+    monkeypatch.setattr(simulation, "CHUNK_ELEMENTS", 50_000)
+    monkeypatch.setattr(simulation, "_pool", None)
+    try:
+        simulate_season(*tables, matches=1, simulations=4000)
+        pool = simulation._pool
+        simulate_season(*tables, matches=1, simulations=4000, seed=1)
+
+        assert pool is not None and simulation._pool is pool
+        assert pool._max_workers == 2
+    finally:
+        if simulation._pool is not None:
+            simulation._pool.shutdown()
+
+
+def test_simulated_output_matches_observed_rates(tables):
+    batting, bowling = tables
+    batting_rates, _ = season_rates(batting, bowling)
+    matches = 5
+    result = simulate_season(batting, bowling, matches=matches, simulations=20000, seed=0, workers=1)
+
+    team_matches = max(batting["Matches"].max(), bowling["Matches"].max())
+    observed = batting_rates["Runs"].sum() / team_matches * matches
+    assert result["runs"].to_numpy().sum(axis=1).mean() == pytest.approx(observed, rel=0.1)
+    assert ((result["wins"] >= 0) & (result["wins"] <= matches)).all()
+
+
+def test_milestones_are_the_next_multiple_above_the_current_total(tables):
+    batting_rates, _ = season_rates(*tables)
+    result = simulate_season(*tables, matches=2, simulations=2000, seed=0, workers=1)
+    projection = project_milestones(result["runs"], batting_rates["Runs"], batting_rates["Name"], 100)
+
+    assert (projection["Next Milestone"] > projection["Current"]).all()
+    assert (projection["Next Milestone"] % 100 == 0).all()
+    assert projection["P(Milestone)"].between(0, 1).all()
+    assert projection["Projected (mean)"].is_monotonic_decreasing
+
+
+def test_chunks_bound_the_draw_arrays(tables, monkeypatch):
+    batting_rates, bowling_rates = season_rates(*tables)
+    players = len(batting_rates) + len(bowling_rates)
+    sizes = []
+    simulate_chunk = simulation._simulate_chunk
+
+    def recording_chunk(batting, bowling, matches, simulations, seed):
+        sizes.append(simulations)
+        return simulate_chunk(batting, bowling, matches, simulations, seed)
+
+    monkeypatch.setattr(simulation, "CHUNK_ELEMENTS", 100 * 4 * players)
+    monkeypatch.setattr(simulation, "_simulate_chunk", recording_chunk)
+    result = simulate_season(*tables, matches=4, simulations=1050, workers=1)
+
+    assert sizes == [100] * 10 + [50]
+    assert len(result["wins"]) == 1050
+
+
+def test_only_the_squad_is_simulated(tables, monkeypatch):
+    batting, bowling = tables
+    monkeypatch.setattr(simulation, "SQUAD_SIZE", 5)
+    batting_rates, bowling_rates = season_rates(batting, bowling)
+
+    assert list(batting_rates.index) == [pid for pid in batting["Player ID"]
+                                         if pid in set(batting.nlargest(5, "Innings")["Player ID"])]
+    assert len(bowling_rates) == 5
+    assert bowling_rates.index.isin(bowling.nlargest(5, "Balls Bowled")["Player ID"]).all()
+
+
+def test_a_running_forecast_blocks_only_requests_for_the_same_one(monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def cached_season(matches, simulations, seed, version):
+        calls.append(matches)
+        if matches == 1:
+            started.set()
+            assert release.wait(10)
+        return matches
+
+    monkeypatch.setattr(simulation, "_cached_season", cached_season)
+    monkeypatch.setattr(simulation, "_simulation_locks", {})
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        slow = pool.submit(simulation.load_season_simulation, 1)
+        assert started.wait(10)
+        same = pool.submit(simulation.load_season_simulation, 1)
+
+        # A different forecast goes ahead while the slow one runs
+        assert simulation.load_season_simulation(2) == 2
+        assert not slow.done() and not same.done()
+
+        release.set()
+        assert slow.result(10) == same.result(10) == 1
+    # The second request for the slow forecast only looked it up once the first had finished
+    assert calls == [1, 2, 1]
@@ -0,0 +1,106 @@
+# tests/test_snapshots.py
+import pandas as pd
+import pytest
+
+import modules.snapshots as snapshots
+from modules.snapshots import compare_versions, list_versions, load_version, record_snapshot, version_at
+
+
+@pytest.fixture(autouse=True)
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshots, "SNAPSHOT_DIR", str(tmp_path))
+    snapshots._reconstruct.cache_clear()
+    yield tmp_path
+    snapshots._reconstruct.cache_clear()
+
+
+def board(runs, names=None):
+    ids = list(runs)
+    return pd.DataFrame({
+        "Player ID": ids,
+        "Player Name": [(names or {}).get(i, f"Player {i}") for i in ids],
+        "Runs": [runs[i] for i in ids],
+        "Average": [runs[i] / 10 for i in ids],
+    })
+
+
+def builds():
+    """Successive builds: stat changes, a new player, a removed player and a rename."""
+    runs = {i: 100 - i for i in range(1, 21)}
+    versions = [board(runs)]
+    for step in range(1, 13):
+        runs = dict(runs)
+        runs[step] += 10 * step
+        if step == 4:
+            runs[99] = 5
+        if step == 7:
+            del runs[20]
+        versions.append(board(runs, names={3: "Renamed"} if step >= 9 else None))
+    return versions
+
+
+def test_every_version_reconstructs_exactly():
+    tables = builds()
+    for df in tables:
+        record_snapshot("batting", df, checkpoint_every=5)
+
+    versions = list_versions("batting")
+    assert versions["version"].tolist() == list(range(1, len(tables) + 1))
+    assert versions["kind"].tolist() == ["full"] + ["delta"] * 4 + ["full"] + ["delta"] * 4 + ["full"] + ["delta"] * 2
+    for version, df in enumerate(tables, start=1):
+        expected = df.sort_values("Player ID").reset_index(drop=True)
+        pd.testing.assert_frame_equal(load_version("batting", version), expected)
+
+
+def test_delta_counts_are_per_version_not_cumulative():
+    tables = builds()
+    for df in tables:
+        record_snapshot("batting", df, checkpoint_every=5)
+
+    deltas = list_versions("batting").set_index("version")
+    # Each step changes one player's Runs and Average
+    assert deltas.loc[2, "changed_cells"] == 2
+    assert deltas.loc[3, "changed_cells"] == 2
+    # Step 4 also adds a player: three cells (name, runs, average) for the new row
+    assert deltas.loc[5, "changed_cells"] == 2 + 3
+    # Step 7 removes a player
+    assert (deltas.loc[8, "changed_cells"], deltas.loc[8, "deleted_rows"]) == (2, 1)
+    # Step 9 renames a player
+    assert deltas.loc[10, "changed_cells"] == 3
+
+
+def test_unchanged_build_records_no_version():
+    df = board({1: 10, 2: 20})
+    assert record_snapshot("batting", df) == 1
+    assert record_snapshot("batting", df.sample(frac=1, random_state=0)) == 1
+    assert len(list_versions("batting")) == 1
+
+
+def test_changed_columns_start_a_new_checkpoint():
+    record_snapshot("batting", board({1: 10, 2: 20}))
+    record_snapshot("batting", board({1: 10, 2: 25}).assign(Extra=1))
+
+    assert list_versions("batting")["kind"].tolist() == ["full", "full"]
+    assert "Extra" in load_version("batting").columns
+
+
+def test_duplicate_keys_are_rejected():
+    df = board({1: 10, 2: 20})
+    with pytest.raises(ValueError, match="not unique"):
+        record_snapshot("batting", pd.concat([df, df]))
+
+
+def test_compare_versions_reports_movers_and_new_entries():
+    record_snapshot("batting", board({1: 50, 2: 40, 3: 30}), recorded_at="2026-01-01")
+    record_snapshot("batting", board({1: 50, 2: 40, 3: 60, 4: 45}), recorded_at="2026-01-09")
+
+    moves = compare_versions("batting", 1, 2, "Runs").set_index("Player ID")
+    assert moves.loc[3, ["Old Rank", "New Rank", "Movement"]].tolist() == [3, 1, 2]
+    assert moves.loc[2, "Movement"] == -2   # Passed by players 3 and 4
+    assert pd.isna(moves.loc[4, "Old Rank"])
+    assert moves.loc[3, "Δ Runs"] == 30
+    assert moves.loc[4, "Δ Runs"] == 45
+
+    assert version_at("batting", "2026-01-05") == 1
+    assert version_at("batting", "2026-02-01") == 2
+    assert version_at("batting", "2025-12-31") is None
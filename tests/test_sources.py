@@ -0,0 +1,147 @@
+# tests/test_sources.py
+import os
+import tarfile
+import zipfile
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from modules import sources
+from modules.sources import (ARCHIVE_CACHE, ARCHIVE_MANIFEST, TOURNAMENTS, all_tournaments, read_leaderboard,
+                             scan_archives)
+
+# The T20 exports, packed once under their known id and once as an unknown tournament
+T20_ID = "1563884"
+KINDS = ["batting", "bowling", "fielding", "mvp"]
+DATA_DIR = sources.DATA_DIR
+
+
+def _loose(kind):
+    return pd.read_csv(os.path.join(DATA_DIR, TOURNAMENTS["T20"][kind]))
+
+
+@pytest.fixture
+def archive_dir(tmp_path, monkeypatch):
+    loose = {kind: _loose(kind) for kind in KINDS}
+    monkeypatch.setattr(sources, "DATA_DIR", str(tmp_path))
+    sources._archive_frames.cache_clear()
+    directory = tmp_path / "archives"
+    directory.mkdir()
+
+    with zipfile.ZipFile(directory / "t20.zip", "w") as archive:
+        for kind, df in loose.items():
+            archive.writestr(f"T20/{T20_ID}_{kind}_leaderboard.csv", df.to_csv(index=False))
+        archive.writestr("T20/readme.txt", "not a leaderboard")
+    for kind in ["batting", "bowling"]:
+        (tmp_path / f"999_{kind}_leaderboard.csv").write_text(loose[kind].to_csv(index=False))
+    with tarfile.open(directory / "spring.tar.gz", "w:gz") as archive:
+        for kind in ["batting", "bowling"]:
+            archive.add(tmp_path / f"999_{kind}_leaderboard.csv", arcname=f"Spring_Cup/999_{kind}_leaderboard.csv")
+    return str(directory)
+
+
+def test_scan_records_leaderboard_members(archive_dir):
+    manifest, changed = scan_archives(archive_dir)
+
+    assert changed == [os.path.join("archives", "spring.tar.gz"), os.path.join("archives", "t20.zip")]
+    assert len(manifest) == 6
+    # A configured id keeps its name, an unknown one is named after its folder
+    names = manifest.groupby("tournament_id")["tournament"].first().to_dict()
+    assert names == {T20_ID: "T20", "999": "Spring Cup"}
+    assert len(os.listdir(os.path.join(archive_dir, ARCHIVE_CACHE))) == 6
+
+
+@pytest.mark.parametrize("tournament, kind", [("T20", "batting"), ("T20", "mvp"), ("Spring Cup", "bowling")])
+def test_archived_leaderboards_read_like_loose_files(archive_dir, tournament, kind):
+    scan_archives(archive_dir)
+    tournaments = all_tournaments(archive_dir)
+
+    assert sources.MEMBER_SEPARATOR in tournaments[tournament][kind]
+    expected = _loose(kind).drop(columns=["team_id"], errors="ignore")
+    assert_frame_equal(read_leaderboard(tournament, kind, tournaments), expected)
+
+
+def test_only_scanning_writes_the_manifest(archive_dir):
+    assert all_tournaments(archive_dir) == TOURNAMENTS
+    assert not os.path.exists(os.path.join(archive_dir, ARCHIVE_MANIFEST))
+
+    scan_archives(archive_dir)
+    assert "Spring Cup" in all_tournaments(archive_dir)
+
+
+def test_unchanged_archives_are_not_parsed_again(archive_dir, monkeypatch):
+    first, _ = scan_archives(archive_dir)
+
+    def fail(path):
+        raise AssertionError(f"{path} was parsed again")
+
+    monkeypatch.setattr(sources, "_iter_members", fail)
+    manifest, changed = scan_archives(archive_dir)
+    assert changed == []
+    assert_frame_equal(manifest, first)
+
+    # Same content with a new mtime (e.g. re-downloaded): hashed, not parsed
+    path = os.path.join(archive_dir, "t20.zip")
+    os.utime(path, ns=(0, 0))
+    manifest, changed = scan_archives(archive_dir)
+    assert changed == []
+    assert (manifest.loc[manifest["archive"] == os.path.join("archives", "t20.zip"), "mtime_ns"] == 0).all()
+
+    # Reads come from the parsed cache
+    tournaments = all_tournaments(archive_dir)
+    assert read_leaderboard("T20", "batting", tournaments)["name"].tolist() == \
+        _loose("batting")["name"].tolist()
+
+
+def test_changed_and_removed_archives(archive_dir):
+    scan_archives(archive_dir)
+    cache_dir = os.path.join(archive_dir, ARCHIVE_CACHE)
+    before = set(os.listdir(cache_dir))
+
+    # Replaced with a one-kind export: read straight from the archive until the next scan
+    path = os.path.join(archive_dir, "t20.zip")
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(f"T20/{T20_ID}_batting_leaderboard.csv", _loose("batting").head(3).to_csv(index=False))
+    assert len(read_leaderboard("T20", "batting", all_tournaments(archive_dir))) == 3
+
+    manifest, changed = scan_archives(archive_dir)
+    assert changed == [os.path.join("archives", "t20.zip")]
+    assert manifest.loc[manifest["tournament"] == "T20", "kind"].tolist() == ["batting"]
+    assert len(read_leaderboard("T20", "batting", all_tournaments(archive_dir))) == 3
+    # The old archive's parsed frames are gone, the untouched archive's are kept
+    after = set(os.listdir(cache_dir))
+    assert len(after) == 3 and len(after & before) == 2
+
+    os.remove(os.path.join(archive_dir, "spring.tar.gz"))
+    manifest, changed = scan_archives(archive_dir)
+    assert changed == []
+    assert set(manifest["tournament"]) == {"T20"}
+    assert len(os.listdir(cache_dir)) == 1
+    assert "Spring Cup" not in all_tournaments(archive_dir)
+
+
+def test_stale_manifest_reads_as_no_export(archive_dir, tmp_path):
+    scan_archives(archive_dir)
+    tournaments = all_tournaments(archive_dir)
+
+    # Replaced by an archive without the bowling member, and not scanned again
+    spring = os.path.join(archive_dir, "spring.tar.gz")
+    with tarfile.open(spring, "w:gz") as archive:
+        archive.add(tmp_path / "999_batting_leaderboard.csv", arcname="Spring_Cup/999_batting_leaderboard.csv")
+    assert read_leaderboard("Spring Cup", "bowling", tournaments) is None
+    assert len(read_leaderboard("Spring Cup", "batting", tournaments)) == len(_loose("batting"))
+
+    os.remove(spring)
+    assert read_leaderboard("Spring Cup", "batting", tournaments) is None
+
+
+def test_deleted_archive_falls_back_to_configured_loose_file(archive_dir, tmp_path):
+    scan_archives(archive_dir)
+    tournaments = all_tournaments(archive_dir)
+    loose = tmp_path / TOURNAMENTS["T20"]["mvp"]
+    loose.parent.mkdir()
+    _loose("mvp").to_csv(loose, index=False)
+
+    os.remove(os.path.join(archive_dir, "t20.zip"))
+    assert_frame_equal(read_leaderboard("T20", "mvp", tournaments), _loose("mvp"))
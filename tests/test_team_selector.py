@@ -0,0 +1,96 @@
+# tests/test_team_selector.py
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from get_mvp_data import merge_mvp_stats
+from modules.data_loader import load_table
+from modules.identity import load_identity_map
+from modules.sources import all_tournaments, read_leaderboard
+from modules.team_selector import best_xi, build_squad
+
+
+@pytest.fixture(scope="module")
+def mvp_squad():
+    """A squad of every team's players, built from the real MVP exports alone."""
+    tournaments = all_tournaments()
+    frames = [df for t in tournaments if (df := read_leaderboard(t, "mvp", tournaments)) is not None]
+    mvp = merge_mvp_stats(*frames, identity=load_identity_map())
+    empty = {name: load_table(name).iloc[0:0] for name in ["batting", "bowling", "fielding"]}
+    return build_squad(empty["batting"], empty["bowling"], empty["fielding"], mvp)
+
+
+def test_every_wicket_keeper_role_in_the_mvp_files_counts_as_keeper(mvp_squad):
+    roles = mvp_squad["Player Role"].dropna()
+    keeper_roles = roles[roles.str.contains("Wicket-keeper")]
+
+    assert set(keeper_roles) >= {"Wicket-keeper batter"}
+    assert mvp_squad.loc[keeper_roles.index, "Keeper"].all()
+    assert not mvp_squad.loc[roles.index.difference(keeper_roles.index), "Keeper"].any()
+
+
+def test_bowling_roles_in_the_mvp_files_count_as_bowlers(mvp_squad):
+    roles = mvp_squad["Player Role"]
+    assert mvp_squad.loc[roles.isin(["Bowler", "All-Rounder"]), "Bowler"].all()
+    assert not mvp_squad.loc[roles.str.endswith("batter", na=False), "Bowler"].any()
+
+
+def test_real_squad_satisfies_the_default_constraints():
+    squad = build_squad(*[load_table(name) for name in ["batting", "bowling", "fielding", "mvp"]])
+    xi = best_xi(squad, min_bowlers=5, require_keeper=True)
+
+    assert len(xi) == 11
+    assert xi["Bowler"].sum() >= 5
+    assert xi["Keeper"].any()
+
+
+def brute_force(squad, value, min_bowlers, require_keeper, overseas, max_overseas):
+    best = -np.inf
+    for team in combinations(squad.index, 11):
+        rows = squad.loc[list(team)]
+        if (rows["Bowler"].sum() >= min_bowlers and (rows["Keeper"].any() or not require_keeper)
+                and rows.index.isin(overseas).sum() <= max_overseas):
+            best = max(best, rows[value].sum())
+    return best
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_best_xi_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    n = 15
+    squad = pd.DataFrame({
+        "Points/Match": rng.uniform(0, 10, n).round(1),
+        "Bowler": rng.random(n) < 0.4,
+        "Keeper": rng.random(n) < 0.15,
+    }, index=pd.Index(range(100, 100 + n), name="Player ID"))
+    overseas = list(rng.choice(squad.index, 5, replace=False))
+    min_bowlers, require_keeper, max_overseas = int(rng.integers(0, 6)), bool(seed % 2), int(rng.integers(1, 5))
+
+    expected = brute_force(squad, "Points/Match", min_bowlers, require_keeper, overseas, max_overseas)
+    if not np.isfinite(expected):
+        with pytest.raises(ValueError):
+            best_xi(squad, min_bowlers=min_bowlers, require_keeper=require_keeper,
+                    overseas=overseas, max_overseas=max_overseas)
+        return
+
+    xi = best_xi(squad, min_bowlers=min_bowlers, require_keeper=require_keeper,
+                 overseas=overseas, max_overseas=max_overseas)
+    assert len(xi) == 11
+    assert xi["Points/Match"].sum() == pytest.approx(expected)
+    assert xi["Bowler"].sum() >= min_bowlers
+    assert xi.index.isin(overseas).sum() <= max_overseas
+    assert xi["Keeper"].any() or not require_keeper
+
+
+def test_unavailable_players_are_never_picked():
+    squad = pd.DataFrame({
+        "Points/Match": np.arange(14, dtype=float),
+        "Bowler": [True] * 14,
+        "Keeper": [True] * 14,
+    }, index=pd.Index(range(14), name="Player ID"))
+    xi = best_xi(squad, unavailable=[13, 12])
+    assert not xi.index.isin([12, 13]).any()
+    with pytest.raises(ValueError):
+        best_xi(squad, unavailable=range(4))